@@ -0,0 +1,135 @@
+"""
+strategy/_kernels.py — Compiled per-bar decision kernels.
+
+Each kernel consumes precomputed indicator arrays for one symbol and
+returns an int8 signal code per bar:
+
+    1   → SignalDirection.LONG
+    0   → SignalDirection.FLAT
+   -1   → SignalDirection.SHORT
+   127  → NO_SIGNAL
+
+Bar i only reads inputs at i (and i-1 for crosses), so the codes carry
+no lookahead.  NaN warm-up values compare False and yield NO_SIGNAL.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from algotrader.core import njit
+
+NO_SIGNAL = 127
+LONG      = 1
+FLAT      = 0
+SHORT     = -1
+
+
+@njit(cache=True)
+def ma_cross_signals(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """LONG on golden cross, FLAT on death cross."""
+    out = np.full(fast.shape[0], NO_SIGNAL, dtype=np.int8)
+    for i in range(1, fast.shape[0]):
+        if fast[i - 1] <= slow[i - 1] and fast[i] > slow[i]:
+            out[i] = LONG
+        elif fast[i - 1] >= slow[i - 1] and fast[i] < slow[i]:
+            out[i] = FLAT
+    return out
+
+
+@njit(cache=True)
+def threshold_signals(x: np.ndarray, lower: float, upper: float) -> np.ndarray:
+    """LONG below `lower`, FLAT above `upper` (RSI-style oscillator)."""
+    out = np.full(x.shape[0], NO_SIGNAL, dtype=np.int8)
+    for i in range(x.shape[0]):
+        if x[i] < lower:
+            out[i] = LONG
+        elif x[i] > upper:
+            out[i] = FLAT
+    return out
+
+
+@njit(cache=True)
+def band_breakout_signals(close: np.ndarray, mid: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """LONG on close above the upper band, FLAT on close below the mid band."""
+    out = np.full(close.shape[0], NO_SIGNAL, dtype=np.int8)
+    for i in range(close.shape[0]):
+        if close[i] > upper[i]:
+            out[i] = LONG
+        elif close[i] < mid[i]:
+            out[i] = FLAT
+    return out
+
+
+@njit(cache=True)
+def momentum_signals(
+    roc: np.ndarray, roc_ma: np.ndarray, atr_pct: np.ndarray, min_atr_pct: float,
+) -> np.ndarray:
+    """LONG on positive, accelerating ROC; FLAT on negative, decelerating ROC."""
+    out = np.full(roc.shape[0], NO_SIGNAL, dtype=np.int8)
+    for i in range(roc.shape[0]):
+        if not atr_pct[i] >= min_atr_pct:
+            continue   # low-vol chop (or warm-up)
+        if roc[i] > 0 and roc[i] > roc_ma[i]:
+            out[i] = LONG
+        elif roc[i] < 0 and roc[i] < roc_ma[i]:
+            out[i] = FLAT
+    return out
+
+
+# ─────────────────────────────────────────────
+# Indicators
+# ─────────────────────────────────────────────
+
+@njit(cache=True)
+def rsi_array(close: np.ndarray, period: int) -> np.ndarray:
+    """
+    RSI over the whole series in one pass, Wilder smoothing
+    (EWM with alpha = 1/period, seeded at the first change).
+    NaN for the first `period` bars and wherever average loss is zero.
+    """
+    n     = close.shape[0]
+    rsi   = np.full(n, np.nan)
+    alpha = 1.0 / period
+    avg_g = 0.0
+    avg_l = 0.0
+    for i in range(1, n):
+        d    = close[i] - close[i - 1]
+        gain = d if d > 0.0 else 0.0
+        loss = -d if d < 0.0 else 0.0
+        if i == 1:
+            avg_g, avg_l = gain, loss
+        else:
+            avg_g = (1.0 - alpha) * avg_g + alpha * gain
+            avg_l = (1.0 - alpha) * avg_l + alpha * loss
+        if i >= period and avg_l != 0.0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_g / avg_l)
+    return rsi
+
+
+@njit(cache=True)
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing mean over `window` bars with a running sum.  Like pandas'
+    rolling(window).mean(): NaN until the window is full and wherever it
+    contains a NaN.
+    """
+    n     = x.shape[0]
+    out   = np.full(n, np.nan)
+    total = 0.0
+    n_nan = 0
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            n_nan += 1
+        else:
+            total += v
+        if i >= window:
+            old = x[i - window]
+            if np.isnan(old):
+                n_nan -= 1
+            else:
+                total -= old
+        if i >= window - 1 and n_nan == 0:
+            out[i] = total / window
+    return out
@@ -5,12 +5,16 @@ Every strategy must subclass BaseStrategy and implement `on_bar`.
 The framework guarantees:
   • `feed.history(symbol, up_to=ts)` never exposes future data.
   • Each strategy instance carries a unique strategy_id for attribution.
+
+Strategies whose decisions are a pure function of past bars can instead
+subclass VectorizedStrategy and produce every signal in one call.
 """
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import List, Mapping, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from algotrader.core import MarketEvent, SignalEvent, SignalDirection
@@ -24,6 +28,9 @@ class BaseStrategy(ABC):
     Subclasses implement `on_bar` and call `self.emit_signal(...)` to
     generate trading signals.  No order management here — that belongs
     to the portfolio/risk layer.
+
+    Before each `on_bar` the engine calls `set_bars`, so `self._active`
+    lists this strategy's symbols that have a bar at the current timestamp.
     """
 
     def __init__(self, strategy_id: str, symbols: List[str]):
@@ -31,16 +38,21 @@ class BaseStrategy(ABC):
         self.symbols     = symbols
         self._signals:   List[SignalEvent] = []
         self._feed:      Optional[BarFeed] = None
+        self._active:    List[str]         = []
 
     def attach_feed(self, feed: BarFeed) -> None:
         """Called by the engine before the backtest loop starts."""
         self._feed = feed
 
+    def set_bars(self, market_events: Mapping[str, MarketEvent]) -> None:
+        """Called by the engine once per bar, before `on_bar`."""
+        self._active = [s for s in self.symbols if s in market_events]
+
     @abstractmethod
     def on_bar(
         self,
         timestamp: pd.Timestamp,
-        market_events: Dict[str, MarketEvent],
+        market_events: Mapping[str, MarketEvent],
     ) -> None:
         """
         Called once per bar.  Implement your signal logic here.
@@ -54,6 +66,16 @@ class BaseStrategy(ABC):
         assert self._feed is not None, "Feed not attached. Call attach_feed first."
         return self._feed.history(symbol, up_to=up_to, n=n)
 
+    def history_np(
+        self, symbol: str, up_to: pd.Timestamp, n: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Safe historical data access as (open, high, low, close, volume)
+        NumPy views — no DataFrame is built.  No lookahead.
+        """
+        assert self._feed is not None, "Feed not attached. Call attach_feed first."
+        return self._feed.history_np(symbol, up_to=up_to, n=n)
+
     def emit_signal(
         self,
         timestamp:   pd.Timestamp,
@@ -80,3 +102,27 @@ class BaseStrategy(ABC):
 
     def on_fill(self, fill) -> None:  # noqa: ANN001
         """Optional hook — strategies can track their own positions."""
+
+
+class VectorizedStrategy(BaseStrategy):
+    """
+    A strategy that emits its whole signal stream up front.
+
+    The engine calls `generate_signals` once, after `attach_feed`, and
+    replays the result bar by bar instead of dispatching `on_bar` — the
+    broker/portfolio loop still runs per bar, so fills are unchanged.
+    Signals for bar i must only depend on bars ≤ i.
+    """
+
+    @abstractmethod
+    def generate_signals(
+        self, feed: BarFeed,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return four aligned arrays, one entry per signal:
+          bar_index  — position in `feed.index`
+          symbol     — symbol name
+          direction  — SignalDirection value (1 / 0 / -1)
+          strength   — 0–1 sizing scalar
+        Signals sharing a bar are replayed in array order.
+        """
@@ -17,16 +17,19 @@ to avoid execution at the signal bar's close — a common source of bias.
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, MutableMapping, Optional, Sequence
 import uuid
 
 import numpy as np
 import pandas as pd
 
 from algotrader.core import (
-    FillEvent, MarketEvent, OrderEvent, OrderSide, OrderStatus, OrderType
+    BUY, HIGH, LIMIT, LOW, MARKET, OPEN, SELL,
+    FillEvent, MarketView, OrderEvent, OrderSide, OrderStatus, OrderType
 )
 
+_SIDES = (OrderSide.BUY, OrderSide.SELL)   # indexed by side code
+
 
 # ─────────────────────────────────────────────
 # Slippage Models
@@ -35,8 +38,23 @@ from algotrader.core import (
 class BaseSlippage(ABC):
     @abstractmethod
     def apply(self, side: OrderSide, price: float, quantity: float,
-               bar: MarketEvent) -> float:
-        """Return the slippage cost (always positive)."""
+               adv: float) -> float:
+        """
+        Return the slippage cost (always positive).
+        `adv` is the bar's dollar volume, max(volume × close, 1).
+        """
+
+    def apply_batch(self, sides: np.ndarray, prices: np.ndarray,
+                    quantities: np.ndarray, advs: np.ndarray) -> np.ndarray:
+        """
+        Slippage for k fills at once.  `sides` holds core.BUY / core.SELL
+        codes and `advs` each fill's bar dollar volume.
+        Falls back to `apply` per fill — override with an array expression.
+        """
+        return np.array([
+            self.apply(_SIDES[s], p, q, a)
+            for s, p, q, a in zip(sides.tolist(), prices.tolist(), quantities.tolist(), advs.tolist())
+        ], dtype=float)
 
 
 class FixedSlippage(BaseSlippage):
@@ -45,9 +63,12 @@ class FixedSlippage(BaseSlippage):
     def __init__(self, bps: float = 5.0):
         self.bps = bps / 10_000
 
-    def apply(self, side, price, quantity, bar):
+    def apply(self, side, price, quantity, adv):
         return price * self.bps
 
+    def apply_batch(self, sides, prices, quantities, advs):
+        return prices * self.bps
+
 
 class VolumeSlippage(BaseSlippage):
     """
@@ -59,11 +80,13 @@ class VolumeSlippage(BaseSlippage):
         self.spread   = spread_bps / 10_000
         self.k        = impact_coeff
 
-    def apply(self, side, price, quantity, bar):
-        adv = max(bar.volume * bar.close, 1)
+    def apply(self, side, price, quantity, adv):
         participation = quantity * price / adv
         return price * (self.spread + self.k * np.sqrt(participation))
 
+    def apply_batch(self, sides, prices, quantities, advs):
+        return prices * (self.spread + self.k * np.sqrt(quantities * prices / advs))
+
 
 # ─────────────────────────────────────────────
 # Commission Models
@@ -74,6 +97,12 @@ class BaseCommission(ABC):
     def calculate(self, quantity: float, fill_price: float) -> float:
         """Return total commission in currency."""
 
+    def calculate_batch(self, quantities: np.ndarray, fill_prices: np.ndarray) -> np.ndarray:
+        """Commission for k fills at once; falls back to `calculate` per fill."""
+        return np.array([
+            self.calculate(q, p) for q, p in zip(quantities.tolist(), fill_prices.tolist())
+        ], dtype=float)
+
 
 class PerShareCommission(BaseCommission):
     def __init__(self, rate: float = 0.005, min_fee: float = 1.0):
@@ -83,6 +112,9 @@ class PerShareCommission(BaseCommission):
     def calculate(self, quantity, fill_price):
         return max(quantity * self.rate, self.min_fee)
 
+    def calculate_batch(self, quantities, fill_prices):
+        return np.maximum(quantities * self.rate, self.min_fee)
+
 
 class PercentCommission(BaseCommission):
     def __init__(self, pct: float = 0.001):   # 10 bps
@@ -91,6 +123,9 @@ class PercentCommission(BaseCommission):
     def calculate(self, quantity, fill_price):
         return quantity * fill_price * self.pct
 
+    def calculate_batch(self, quantities, fill_prices):
+        return quantities * fill_prices * self.pct
+
 
 class TieredCommission(BaseCommission):
     """
@@ -107,14 +142,19 @@ class TieredCommission(BaseCommission):
 
     def __init__(self, tiers=None):
         self.tiers = sorted(tiers or self.DEFAULT_TIERS)
+        self._thresholds = np.array([t for t, _ in self.tiers], dtype=float)
+        self._rates      = np.array([r for _, r in self.tiers], dtype=float)
 
     def calculate(self, quantity, fill_price):
         notional = quantity * fill_price
-        rate = self.tiers[0][1]
-        for threshold, r in self.tiers:
-            if notional >= threshold:
-                rate = r
-        return notional * rate
+        # Highest tier whose threshold ≤ notional (first tier below the floor)
+        idx = max(int(np.searchsorted(self._thresholds, notional, side="right")) - 1, 0)
+        return notional * float(self._rates[idx])
+
+    def calculate_batch(self, quantities, fill_prices):
+        notional = quantities * fill_prices
+        idx = np.maximum(np.searchsorted(self._thresholds, notional, side="right") - 1, 0)
+        return notional * self._rates[idx]
 
 
 # ─────────────────────────────────────────────
@@ -143,72 +183,123 @@ class SimulatedBroker:
         self.slippage         = slippage  or FixedSlippage(bps=5)
         self.commission       = commission or PercentCommission(pct=0.001)
         self.max_bars_pending = max_bars_pending
-        self._pending: List[Dict] = []   # {"order": OrderEvent, "bars_waited": int}
+        # [{"order": OrderEvent, "bars_waited": int,
+        #   "side": BUY|SELL, "type": MARKET|LIMIT}, ...] in submission order
+        self._pending: List[Dict] = []
 
     def submit(self, order: OrderEvent) -> None:
-        self._pending.append({"order": order, "bars_waited": 0})
+        # Resolve the Enums to int codes once; the fill loop compares ints
+        self._pending.append({
+            "order":       order,
+            "bars_waited": 0,
+            "side":        SELL if order.side is OrderSide.SELL else BUY,
+            "type":        LIMIT if order.order_type is OrderType.LIMIT else MARKET,
+        })
 
     def process_bar(
         self,
-        market_events: Dict[str, MarketEvent],
-        strategy_id_map: Dict[str, str],   # order_id → strategy_id
+        market_events: MarketView,
+        strategy_id_map: MutableMapping[int, str],   # order_id → strategy_id
     ) -> List[FillEvent]:
         """
         Attempt to fill all pending orders against the current bar.
-        Returns a list of FillEvents.
+        Returns a list of FillEvents.  Orders that fill or expire are
+        removed from `strategy_id_map`.
+
+        Fill prices are decided per order; slippage and commission are then
+        priced for all of this bar's fills in one vectorised pass.
         """
-        fills: List[FillEvent] = []
+        filled:     List[OrderEvent] = []
+        sides:      List[int]        = []
+        raw_prices: List[float]      = []
+        fill_rows:  List[int]        = []
+
+        # Orders are walked in submission order, so same-bar fills keep that
+        # order; every feed bar counts toward expiry, but an order whose
+        # symbol has no bar this timestamp just waits.
+        rows, ids = market_events.bars, market_events.symbol_ids
+        bars: Dict[str, list] = {}          # symbol → [o, h, l, c, v] this bar
         still_pending = []
 
         for item in self._pending:
             order: OrderEvent = item["order"]
             item["bars_waited"] += 1
 
-            bar = market_events.get(order.symbol)
-            if bar is None:
+            symbol = order.symbol
+            if symbol not in market_events:
                 still_pending.append(item)
                 continue
+            j   = ids[symbol]
+            bar = bars.get(symbol)
+            if bar is None:
+                bar = bars[symbol] = rows[j].tolist()
 
-            fill_price = self._try_fill(order, bar)
+            fill_price = self._try_fill(order, item["side"], item["type"], bar)
 
             if fill_price is not None:
-                slip = self.slippage.apply(order.side, fill_price, order.quantity, bar)
-                if order.side == OrderSide.BUY:
-                    fill_price += slip
-                else:
-                    fill_price -= slip
-
-                comm = self.commission.calculate(order.quantity, fill_price)
-                order.status = OrderStatus.FILLED
-
-                fills.append(FillEvent(
-                    timestamp=bar.timestamp,
-                    symbol=order.symbol,
-                    side=order.side,
-                    quantity=order.quantity,
-                    fill_price=fill_price,
-                    commission=comm,
-                    slippage=slip * order.quantity,
-                    order_id=order.order_id,
-                    strategy_id=strategy_id_map.get(order.order_id, ""),
-                ))
+                filled.append(order)
+                sides.append(item["side"])
+                raw_prices.append(fill_price)
+                fill_rows.append(j)
             elif item["bars_waited"] >= self.max_bars_pending:
                 order.status = OrderStatus.CANCELLED
+                strategy_id_map.pop(order.order_id, None)
             else:
                 still_pending.append(item)
 
         self._pending = still_pending
+
+        if not filled:
+            return []
+        return self._price_fills(
+            market_events.timestamp, filled, np.array(sides, dtype=np.int8),
+            np.array(raw_prices), market_events.adv[fill_rows], strategy_id_map,
+        )
+
+    def _price_fills(
+        self,
+        timestamp:       pd.Timestamp,
+        orders:          List[OrderEvent],
+        sides:           np.ndarray,   # (k,) BUY / SELL codes
+        prices:          np.ndarray,   # (k,) pre-slippage fill prices
+        advs:            np.ndarray,   # (k,) bar dollar volume of each order's symbol
+        strategy_id_map: MutableMapping[int, str],
+    ) -> List[FillEvent]:
+        qtys = np.array([o.quantity for o in orders], dtype=float)
+        sign = 1 - 2 * sides.astype(float)             # BUY → +1, SELL → -1
+
+        slip        = self.slippage.apply_batch(sides, prices, qtys, advs)
+        fill_prices = prices + sign * slip
+        comms       = self.commission.calculate_batch(qtys, fill_prices)
+
+        fills: List[FillEvent] = []
+        for order, fp, comm, slip_cost in zip(
+            orders, fill_prices.tolist(), comms.tolist(), (slip * qtys).tolist()
+        ):
+            order.status = OrderStatus.FILLED
+            fills.append(FillEvent(
+                timestamp=timestamp,
+                symbol=order.symbol,
+                side=order.side,
+                quantity=order.quantity,
+                fill_price=fp,
+                commission=comm,
+                slippage=slip_cost,
+                order_id=order.order_id,
+                strategy_id=strategy_id_map.pop(order.order_id, ""),
+            ))
         return fills
 
-    def _try_fill(self, order: OrderEvent, bar: MarketEvent) -> Optional[float]:
-        if order.order_type == OrderType.MARKET:
-            return bar.open   # next bar open
+    def _try_fill(self, order: OrderEvent, side: int, order_type: int,
+                  bar: Sequence[float]) -> Optional[float]:
+        if order_type == MARKET:
+            return bar[OPEN]   # next bar open
 
-        if order.order_type == OrderType.LIMIT:
+        if order_type == LIMIT:
             lp = order.limit_price
-            if order.side == OrderSide.BUY and bar.low <= lp:
-                return min(lp, bar.open)
-            if order.side == OrderSide.SELL and bar.high >= lp:
-                return max(lp, bar.open)
+            if side == BUY and bar[LOW] <= lp:
+                return min(lp, bar[OPEN])
+            if side == SELL and bar[HIGH] >= lp:
+                return max(lp, bar[OPEN])
 
         return None
@@ -1,14 +1,26 @@
 """
 core.py — Shared enums, dataclasses, and event types.
 All layers communicate through typed events to avoid tight coupling.
+Events are slotted dataclasses: fixed layout, no per-instance __dict__.
 """
 
 from __future__ import annotations
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional
+from typing import Dict, Optional, Sequence
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:                       # numba is optional
+    def njit(*args, **kwargs):
+        """No-op stand-in: kernels run as plain Python when numba is absent."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
 
 # ─────────────────────────────────────────────
 # Enums
@@ -33,12 +45,16 @@ class SignalDirection(Enum):
     SHORT = -1
     FLAT  = 0
 
+# Integer codes for hot loops; the Enums above remain the public API.
+BUY, SELL     = 0, 1      # OrderSide    → sign = 1 - 2 * side
+MARKET, LIMIT = 0, 1      # OrderType
+
 
 # ─────────────────────────────────────────────
 # Events
 # ─────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class MarketEvent:
     """Fired once per bar for each symbol."""
     timestamp: pd.Timestamp
@@ -50,7 +66,60 @@ class MarketEvent:
     volume:    float
 
 
-@dataclass
+# Column layout of a columnar OHLCV row (see MarketView)
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+
+
+class MarketView(Mapping):
+    """
+    One bar across every symbol of a feed, backed by the feed's columnar
+    (n_bars, n_symbols, 5) OHLCV block — no per-symbol objects are built.
+
+    Reads like the old Dict[str, MarketEvent] (events are materialised
+    lazily on access).  Hot paths skip that and index directly:
+        row = view.bars[view.symbol_ids[symbol]]     # [o, h, l, c, v]
+    `adv` is the feed's precomputed bar dollar volume, max(volume × close, 1).
+    """
+    __slots__ = ("timestamp", "i", "bars", "present", "adv", "symbols", "symbol_ids")
+
+    def __init__(
+        self,
+        timestamp:  pd.Timestamp,
+        i:          int,                  # bar index in the feed
+        bars:       np.ndarray,           # (n_symbols, 5) view for this bar
+        present:    np.ndarray,           # (n_symbols,) bool — symbol has a bar
+        adv:        np.ndarray,           # (n_symbols,) bar dollar volume
+        symbols:    Sequence[str],
+        symbol_ids: Dict[str, int],
+    ):
+        self.timestamp  = timestamp
+        self.i          = i
+        self.bars       = bars
+        self.present    = present
+        self.adv        = adv
+        self.symbols    = symbols
+        self.symbol_ids = symbol_ids
+
+    def __contains__(self, symbol) -> bool:
+        j = self.symbol_ids.get(symbol)
+        return j is not None and bool(self.present[j])
+
+    def __getitem__(self, symbol: str) -> MarketEvent:
+        j = self.symbol_ids.get(symbol)
+        if j is None or not self.present[j]:
+            raise KeyError(symbol)
+        o, h, l, c, v = self.bars[j].tolist()
+        return MarketEvent(self.timestamp, symbol, o, h, l, c, v)
+
+    def __iter__(self):
+        return (s for s, p in zip(self.symbols, self.present.tolist()) if p)
+
+    def __len__(self) -> int:
+        return int(self.present.sum())
+
+
+@dataclass(slots=True)
 class SignalEvent:
     """Emitted by a Strategy when it detects an opportunity."""
     timestamp:   pd.Timestamp
@@ -62,7 +131,7 @@ class SignalEvent:
     take_profit: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderEvent:
     """Created by the Portfolio / RiskManager from a SignalEvent."""
     timestamp:  pd.Timestamp
@@ -73,11 +142,11 @@ class OrderEvent:
     limit_price: Optional[float] = None
     stop_loss:   Optional[float] = None
     take_profit: Optional[float] = None
-    order_id:   str = field(default_factory=lambda: _next_id())
+    order_id:   int = field(default_factory=lambda: _next_id())
     status:     OrderStatus = OrderStatus.PENDING
 
 
-@dataclass
+@dataclass(slots=True)
 class FillEvent:
     """Returned by the Execution Layer after an order is filled."""
     timestamp:   pd.Timestamp
@@ -87,7 +156,7 @@ class FillEvent:
     fill_price:  float
     commission:  float
     slippage:    float
-    order_id:    str
+    order_id:    int
     strategy_id: str = ""
 
 
@@ -97,7 +166,8 @@ class FillEvent:
 
 _order_counter = 0
 
-def _next_id() -> str:
+def _next_id() -> int:
+    """Sequential integer order id — cheap to hash and usable as an array offset."""
     global _order_counter
     _order_counter += 1
-    return f"ORD-{_order_counter:06d}"
+    return _order_counter
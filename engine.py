@@ -4,9 +4,10 @@ engine.py — The Backtest Engine.
 The engine is the orchestrator. It wires every layer together and drives
 the event loop.  The loop order per bar is:
 
-  1. Emit MarketEvents for the current bar
+  1. Emit the MarketView for the current bar
   2. Check stop-loss / take-profit on existing positions (risk manager)
-  3. Call each strategy's on_bar() (strategy layer)
+  3. Call each strategy's on_bar() (strategy layer) — or, for
+     VectorizedStrategies, slice their merged precomputed signals for this bar
   4. Collect signals → risk manager → orders (risk/execution layer)
   5. Submit orders to broker
   6. Process bar fills (execution layer)
@@ -23,16 +24,19 @@ This strictly prevents lookahead bias:
 from __future__ import annotations
 import logging
 import time
-from typing import Dict, List, Optional, Type
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Tuple, Type
 
 import pandas as pd
 
-from algotrader.core import FillEvent, OrderEvent, OrderSide
+import numpy as np
+
+from algotrader.core import FillEvent, OrderEvent, OrderSide, SignalDirection, SignalEvent
 from algotrader.data.loader import BarFeed
 from algotrader.execution.broker import SimulatedBroker, FixedSlippage, PercentCommission
 from algotrader.portfolio.portfolio import Portfolio
 from algotrader.risk.manager import RiskManager
-from algotrader.strategy.base import BaseStrategy
+from algotrader.strategy.base import BaseStrategy, VectorizedStrategy
 from algotrader.analytics.performance import full_report
 from algotrader.reporting.report import BacktestReport
 
@@ -64,14 +68,15 @@ class BacktestEngine:
     ):
         self.feed            = feed
         self.strategies      = strategies
-        self.portfolio       = Portfolio(initial_capital)
+        self.portfolio       = Portfolio(initial_capital, n_bars=len(feed.index))
         self.broker          = broker    or SimulatedBroker()
         self.risk_manager    = risk_manager or RiskManager()
         self.risk_free_rate  = risk_free_rate
         self.verbose         = verbose
 
-        # order_id → strategy_id mapping (for fill attribution)
-        self._order_strategy_map: Dict[str, str] = {}
+        # order_id → strategy_id for live orders (for fill attribution);
+        # the broker drops entries once an order fills or is cancelled
+        self._order_strategy_map = _OrderAttribution()
 
         # Attach feed to all strategies
         for strat in strategies:
@@ -86,6 +91,20 @@ class BacktestEngine:
                  len(self.strategies), len(self.feed.symbols))
         t0 = time.time()
         bar_count = 0
+        next_log  = 252 if self.verbose else -1   # -1: never log progress
+
+        # Vectorised strategies: signal streams computed once.  Consecutive
+        # ones are merged into a single stream, so an all-vectorised run
+        # dispatches every strategy × symbol with one slice per bar.
+        dispatch: List = []
+        for strat in self.strategies:
+            if not isinstance(strat, VectorizedStrategy):
+                dispatch.append(strat)
+            elif dispatch and isinstance(dispatch[-1], list):
+                dispatch[-1].append(strat)
+            else:
+                dispatch.append([strat])
+        dispatch = [self._replay_signals(d) if isinstance(d, list) else d for d in dispatch]
 
         for timestamp, market_events in self.feed:
             bar_count += 1
@@ -99,7 +118,13 @@ class BacktestEngine:
 
             # ── 2. Run strategies ──────────────────────────────────────
             all_signals = []
-            for strat in self.strategies:
+            i = market_events.i
+            for strat in dispatch:
+                if isinstance(strat, tuple):
+                    events, bounds = strat
+                    all_signals.extend(events[bounds[i]:bounds[i + 1]])
+                    continue
+                strat.set_bars(market_events)
                 strat.on_bar(timestamp, market_events)
                 all_signals.extend(strat.flush_signals())
 
@@ -110,10 +135,13 @@ class BacktestEngine:
                 feed=self.feed,
                 equity=self.portfolio.equity,
                 open_positions=self.portfolio.open_positions,
+                n_long_positions=self.portfolio.n_long_positions,
             )
+            sig_by_sym = {}
+            for sig in all_signals:
+                sig_by_sym.setdefault(sig.symbol, sig.strategy_id)   # first signal wins
             for order in orders:
-                sig = next((s for s in all_signals if s.symbol == order.symbol), None)
-                self._submit(order, strategy_id=sig.strategy_id if sig else "")
+                self._submit(order, strategy_id=sig_by_sym.get(order.symbol, ""))
 
             # ── 4. Execute pending orders against this bar ────────────
             fills = self.broker.process_bar(market_events, self._order_strategy_map)
@@ -128,7 +156,8 @@ class BacktestEngine:
             # ── 6. Mark-to-market ─────────────────────────────────────
             equity = self.portfolio.mark_to_market(timestamp, market_events)
 
-            if self.verbose and bar_count % 252 == 0:
+            if bar_count == next_log:
+                next_log += 252
                 log.info("  %s  equity=$%.0f  positions=%d",
                          timestamp.date(), equity, len(self.portfolio.open_positions))
 
@@ -142,11 +171,130 @@ class BacktestEngine:
             risk_free_rate=self.risk_free_rate,
         )
 
+    def _replay_signals(
+        self, strategies: List[VectorizedStrategy],
+    ) -> Tuple[List[SignalEvent], List[int]]:
+        """
+        Run vectorised strategies once and merge their signal streams.
+        Returns (events, bounds): bar i's signals are events[bounds[i]:bounds[i + 1]],
+        ordered by strategy, then by each strategy's emission order.
+        """
+        parts = [s.generate_signals(self.feed) for s in strategies]
+        sids       = np.concatenate([np.full(len(p[0]), k, dtype=np.intp) for k, p in enumerate(parts)])
+        bars       = np.concatenate([np.asarray(p[0], dtype=np.intp) for p in parts])
+        symbols    = np.concatenate([np.asarray(p[1], dtype=object) for p in parts])
+        directions = np.concatenate([np.asarray(p[2]) for p in parts])
+        strengths  = np.concatenate([np.asarray(p[3], dtype=float) for p in parts])
+
+        # Streams are concatenated in strategy order, so a stable sort on
+        # bar keeps (strategy, emission) order within each bar
+        order = np.argsort(bars, kind="stable")
+        bars  = bars[order]
+        index = self.feed.index
+        names = [s.strategy_id for s in strategies]
+
+        events = [
+            SignalEvent(
+                timestamp=index[i],
+                symbol=symbol,
+                strategy_id=names[k],
+                direction=SignalDirection(d),
+                strength=st,
+            )
+            for i, k, symbol, d, st in zip(
+                bars.tolist(),
+                sids[order].tolist(),
+                symbols[order].tolist(),
+                directions[order].tolist(),
+                np.clip(strengths[order], 0.0, 1.0).tolist(),
+            )
+        ]
+        bounds = np.searchsorted(bars, np.arange(len(index) + 1), side="left")
+        return events, bounds.tolist()
+
     def _submit(self, order: OrderEvent, strategy_id: str = "") -> None:
         self._order_strategy_map[order.order_id] = strategy_id
         self.broker.submit(order)
 
 
+# ─────────────────────────────────────────────
+# Order attribution
+# ─────────────────────────────────────────────
+
+class _OrderAttribution(MutableMapping):
+    """
+    order_id → strategy_id, stored positionally.
+
+    Order ids are sequential ints, so a list offset by the first id seen
+    replaces a dict: lookups are an index, not a hash.  Released entries
+    become None, and a released prefix is dropped, so the list only spans
+    the window from the oldest live order to the newest.
+    """
+
+    __slots__ = ("_base", "_ids", "_live")
+
+    def __init__(self):
+        self._base: Optional[int]         = None
+        self._ids:  List[Optional[str]]   = []
+        self._live: int                   = 0
+
+    def _slot(self, order_id: int) -> int:
+        k = -1 if self._base is None else order_id - self._base
+        return k if 0 <= k < len(self._ids) else -1
+
+    def _release(self, k: int) -> None:
+        self._ids[k] = None
+        self._live  -= 1
+        if k == 0:                                  # oldest live order gone
+            ids = self._ids
+            n   = next((m for m, sid in enumerate(ids) if sid is not None), len(ids))
+            del ids[:n]
+            self._base += n
+
+    def __setitem__(self, order_id: int, strategy_id: str) -> None:
+        if self._base is None or not self._ids:
+            self._base = order_id
+        k = order_id - self._base
+        if k < 0:                                   # older id submitted late
+            self._ids[:0] = [None] * -k
+            self._base, k = order_id, 0
+        if k >= len(self._ids):
+            self._ids.extend([None] * (k + 1 - len(self._ids)))
+        if self._ids[k] is None:
+            self._live += 1
+        self._ids[k] = strategy_id
+
+    def __getitem__(self, order_id: int) -> str:
+        k = self._slot(order_id)
+        if k < 0 or self._ids[k] is None:
+            raise KeyError(order_id)
+        return self._ids[k]
+
+    def __delitem__(self, order_id: int) -> None:
+        self[order_id]                                # KeyError if absent
+        self._release(self._slot(order_id))
+
+    def __iter__(self) -> Iterator[int]:
+        return (self._base + k for k, sid in enumerate(self._ids) if sid is not None)
+
+    def __len__(self) -> int:
+        return self._live
+
+    # Fast paths — the mixin versions go through KeyError handling
+    def get(self, order_id: int, default=None):
+        k = self._slot(order_id)
+        sid = self._ids[k] if k >= 0 else None
+        return default if sid is None else sid
+
+    def pop(self, order_id: int, default=None):
+        k = self._slot(order_id)
+        sid = self._ids[k] if k >= 0 else None
+        if sid is None:
+            return default
+        self._release(k)
+        return sid
+
+
 # ─────────────────────────────────────────────
 # Result wrapper
 # ─────────────────────────────────────────────
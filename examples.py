@@ -5,28 +5,110 @@ strategies/examples.py — Plug-and-play example strategies.
 2. RSIMeanReversion        — Buy oversold, sell overbought
 3. BollingerBandBreakout   — Breakout on band expansion
 4. MomentumStrategy        — Rate-of-change momentum with ATR filter
+
+Indicators are precomputed once per symbol in `attach_feed` with trailing
+(causal) windows and reduced to a per-bar signal code by a compiled
+kernel, so `on_bar` is an index lookup.  The code at bar i only ever
+depends on bars ≤ i — no lookahead.
 """
 
 from __future__ import annotations
-from typing import Dict, List
+import logging
+from abc import abstractmethod
+from typing import Dict, List, Mapping, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from algotrader.core import MarketEvent, SignalDirection
-from algotrader.strategy.base import BaseStrategy
+from algotrader.data.loader import BarFeed
+from algotrader.risk.manager import atr_series
+from algotrader.strategy import _kernels
+from algotrader.strategy._kernels import NO_SIGNAL
+from algotrader.strategy.base import VectorizedStrategy
+
+log = logging.getLogger(__name__)
+
+
+def _entry_strength(codes: np.ndarray, strength: np.ndarray) -> np.ndarray:
+    """`strength` on LONG/SHORT bars; FLAT (exit) signals keep the default 1.0."""
+    directional = (codes == _kernels.LONG) | (codes == _kernels.SHORT)
+    return np.where(directional, strength, 1.0)
+
+
+class _PrecomputedSignals(VectorizedStrategy):
+    """
+    Shared plumbing: subclasses turn a symbol's full history into
+    (codes, strength) arrays once.  The engine takes them in bulk via
+    `generate_signals`; `on_bar` replays them when driven bar by bar.
+    """
+
+    def __init__(self, strategy_id: str, symbols: List[str]):
+        super().__init__(strategy_id, symbols)
+        self._row:      Dict[str, np.ndarray] = {}   # feed bar index → symbol row
+        self._codes:    Dict[str, np.ndarray] = {}
+        self._strength: Dict[str, Optional[np.ndarray]] = {}
+
+    @abstractmethod
+    def _compute_signals(self, df: pd.DataFrame) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Return int8 signal codes and optional per-bar strength for `df`."""
+
+    def attach_feed(self, feed: BarFeed) -> None:
+        super().attach_feed(feed)
+        available = set(feed.symbols)
+        for symbol in self.symbols:
+            if symbol not in available:
+                # Never appears in a bar, so it can never signal — as before
+                log.warning("[%s] Symbol %s not in feed — skipped.", self.strategy_id, symbol)
+                continue
+            df  = feed.get_full(symbol)
+            row = np.full(len(feed.index), -1, dtype=np.intp)
+            row[feed.bar_positions(symbol)] = np.arange(len(df))
+            self._row[symbol] = row
+            self._codes[symbol], self._strength[symbol] = self._compute_signals(df)
+
+    def generate_signals(self, feed: BarFeed):
+        bars, syms, dirs, strengths = [], [], [], []
+        for symbol, codes in self._codes.items():
+            hit   = np.flatnonzero(codes != NO_SIGNAL)
+            strength = self._strength[symbol]
+
+            bars.append(feed.bar_positions(symbol)[hit])
+            syms.append(np.full(hit.size, symbol, dtype=object))
+            dirs.append(codes[hit])
+            strengths.append(np.ones(hit.size) if strength is None else strength[hit])
+
+        if not bars:
+            return (np.empty(0, dtype=np.intp), np.empty(0, dtype=object),
+                    np.empty(0, dtype=np.int8), np.empty(0))
+        return (np.concatenate(bars), np.concatenate(syms),
+                np.concatenate(dirs), np.concatenate(strengths))
+
+    def on_bar(self, timestamp: pd.Timestamp, market_events: Mapping[str, MarketEvent]) -> None:
+        bar = market_events.i   # MarketView carries the feed bar index
+        for symbol in self._active:
+            i    = self._row[symbol][bar]
+            code = self._codes[symbol][i]
+            if code == NO_SIGNAL:
+                continue
+
+            strength = self._strength[symbol]
+            self.emit_signal(
+                timestamp, symbol, SignalDirection(int(code)),
+                strength=1.0 if strength is None else float(strength[i]),
+            )
 
 
 # ─────────────────────────────────────────────
 # 1. Moving Average Crossover
 # ─────────────────────────────────────────────
 
-class MovingAverageCrossover(BaseStrategy):
+class MovingAverageCrossover(_PrecomputedSignals):
     """
     Go long when fast SMA crosses above slow SMA.
     Exit (go flat) when fast SMA crosses below slow SMA.
 
-    Anti-lookahead: uses history strictly up_to current timestamp.
+    Anti-lookahead: rolling means are trailing; bar i reads [i-1, i] only.
     """
 
     def __init__(
@@ -39,42 +121,19 @@ class MovingAverageCrossover(BaseStrategy):
         super().__init__(strategy_id, symbols)
         self.fast = fast_period
         self.slow = slow_period
-        self._prev_fast: Dict[str, float] = {}
-        self._prev_slow: Dict[str, float] = {}
-
-    def on_bar(self, timestamp: pd.Timestamp, market_events: Dict[str, MarketEvent]) -> None:
-        for symbol in self.symbols:
-            if symbol not in market_events:
-                continue
-
-            hist = self.history(symbol, up_to=timestamp, n=self.slow + 5)
-            if len(hist) < self.slow:
-                continue
-
-            closes = hist["close"]
-            fast_ma = closes.iloc[-self.fast:].mean()
-            slow_ma = closes.iloc[-self.slow:].mean()
-
-            prev_fast = self._prev_fast.get(symbol, fast_ma)
-            prev_slow = self._prev_slow.get(symbol, slow_ma)
-
-            # Golden cross
-            if prev_fast <= prev_slow and fast_ma > slow_ma:
-                self.emit_signal(timestamp, symbol, SignalDirection.LONG)
 
-            # Death cross
-            elif prev_fast >= prev_slow and fast_ma < slow_ma:
-                self.emit_signal(timestamp, symbol, SignalDirection.FLAT)
-
-            self._prev_fast[symbol] = fast_ma
-            self._prev_slow[symbol] = slow_ma
+    def _compute_signals(self, df):
+        close = df["close"]
+        fast  = close.rolling(self.fast).mean().to_numpy()
+        slow  = close.rolling(self.slow).mean().to_numpy()
+        return _kernels.ma_cross_signals(fast, slow), None
 
 
 # ─────────────────────────────────────────────
 # 2. RSI Mean Reversion
 # ─────────────────────────────────────────────
 
-class RSIMeanReversion(BaseStrategy):
+class RSIMeanReversion(_PrecomputedSignals):
     """
     Buy when RSI < oversold_level; sell when RSI > overbought_level.
     Signal strength is inversely proportional to RSI (deeper = stronger).
@@ -93,37 +152,22 @@ class RSIMeanReversion(BaseStrategy):
         self.oversold   = oversold_level
         self.overbought = overbought_level
 
-    def _compute_rsi(self, closes: pd.Series) -> float:
-        delta  = closes.diff().dropna()
-        gain   = delta.clip(lower=0).ewm(com=self.period - 1, adjust=False).mean()
-        loss   = (-delta.clip(upper=0)).ewm(com=self.period - 1, adjust=False).mean()
-        rs     = gain / loss.replace(0, np.nan)
-        return float(100 - 100 / (1 + rs.iloc[-1]))
-
-    def on_bar(self, timestamp: pd.Timestamp, market_events: Dict[str, MarketEvent]) -> None:
-        for symbol in self.symbols:
-            if symbol not in market_events:
-                continue
-
-            hist = self.history(symbol, up_to=timestamp, n=self.period * 3)
-            if len(hist) < self.period + 1:
-                continue
-
-            rsi = self._compute_rsi(hist["close"])
-
-            if rsi < self.oversold:
-                strength = (self.oversold - rsi) / self.oversold   # deeper = stronger
-                self.emit_signal(timestamp, symbol, SignalDirection.LONG, strength=strength)
+    def _compute_rsi(self, closes: pd.Series) -> np.ndarray:
+        """RSI for the whole series (Wilder smoothing); NaN during warm-up."""
+        return _kernels.rsi_array(closes.to_numpy(dtype=np.float64), self.period)
 
-            elif rsi > self.overbought:
-                self.emit_signal(timestamp, symbol, SignalDirection.FLAT)
+    def _compute_signals(self, df):
+        rsi      = self._compute_rsi(df["close"])
+        codes    = _kernels.threshold_signals(rsi, self.oversold, self.overbought)
+        strength = (self.oversold - rsi) / self.oversold   # deeper = stronger
+        return codes, _entry_strength(codes, strength)
 
 
 # ─────────────────────────────────────────────
 # 3. Bollinger Band Breakout
 # ─────────────────────────────────────────────
 
-class BollingerBandBreakout(BaseStrategy):
+class BollingerBandBreakout(_PrecomputedSignals):
     """
     Enter long on close above upper band (momentum breakout variant).
     Exit when price reverts below the middle band.
@@ -140,32 +184,21 @@ class BollingerBandBreakout(BaseStrategy):
         self.period = period
         self.n_std  = n_std
 
-    def on_bar(self, timestamp: pd.Timestamp, market_events: Dict[str, MarketEvent]) -> None:
-        for symbol in self.symbols:
-            if symbol not in market_events:
-                continue
-
-            bar  = market_events[symbol]
-            hist = self.history(symbol, up_to=timestamp, n=self.period + 5)
-            if len(hist) < self.period:
-                continue
-
-            closes = hist["close"]
-            mid    = closes.rolling(self.period).mean().iloc[-1]
-            std    = closes.rolling(self.period).std(ddof=1).iloc[-1]
-            upper  = mid + self.n_std * std
-
-            if bar.close > upper:
-                self.emit_signal(timestamp, symbol, SignalDirection.LONG)
-            elif bar.close < mid:
-                self.emit_signal(timestamp, symbol, SignalDirection.FLAT)
+    def _compute_signals(self, df):
+        close = df["close"]
+        mid   = close.rolling(self.period).mean()
+        std   = close.rolling(self.period).std(ddof=1)
+        upper = mid + self.n_std * std
+        return _kernels.band_breakout_signals(
+            close.to_numpy(), mid.to_numpy(), upper.to_numpy()
+        ), None
 
 
 # ─────────────────────────────────────────────
 # 4. Momentum (Rate of Change)
 # ─────────────────────────────────────────────
 
-class MomentumStrategy(BaseStrategy):
+class MomentumStrategy(_PrecomputedSignals):
     """
     Buy when N-day ROC is positive AND above its own moving average.
     Uses ATR filter to avoid low-volatility chop.
@@ -186,34 +219,14 @@ class MomentumStrategy(BaseStrategy):
         self.atr_period  = atr_period
         self.min_atr_pct = min_atr_pct
 
-    def on_bar(self, timestamp: pd.Timestamp, market_events: Dict[str, MarketEvent]) -> None:
-        from algotrader.risk.manager import compute_atr
-
-        for symbol in self.symbols:
-            if symbol not in market_events:
-                continue
-
-            bar  = market_events[symbol]
-            n    = max(self.roc_period, self.atr_period) + self.ma_period + 5
-            hist = self.history(symbol, up_to=timestamp, n=n)
-            if len(hist) < n // 2:
-                continue
-
-            closes = hist["close"]
-            roc    = (closes.iloc[-1] / closes.iloc[-self.roc_period] - 1) * 100
-            roc_ma = pd.Series(
-                [(closes.iloc[i] / closes.iloc[i - self.roc_period] - 1) * 100
-                 for i in range(self.roc_period, len(closes))]
-            ).rolling(self.ma_period).mean().iloc[-1]
-
-            atr      = compute_atr(hist, self.atr_period)
-            atr_pct  = atr / bar.close if bar.close > 0 else 0
-
-            if atr_pct < self.min_atr_pct:
-                continue   # avoid choppy, low-vol regimes
-
-            if roc > 0 and roc > roc_ma:
-                strength = min(1.0, roc / 10)   # scale by momentum magnitude
-                self.emit_signal(timestamp, symbol, SignalDirection.LONG, strength=strength)
-            elif roc < 0 and roc < roc_ma:
-                self.emit_signal(timestamp, symbol, SignalDirection.FLAT)
+    def _compute_signals(self, df):
+        close   = df["close"].to_numpy(dtype=np.float64)
+        k       = self.roc_period
+        roc     = np.full(close.shape[0], np.nan)
+        roc[k:] = (close[k:] / close[:-k] - 1) * 100
+        roc_ma  = _kernels.rolling_mean(roc, self.ma_period)
+        atr_pct = atr_series(df, self.atr_period).to_numpy() / np.where(close > 0, close, np.nan)
+
+        codes = _kernels.momentum_signals(roc, roc_ma, atr_pct, self.min_atr_pct)
+        strength = np.minimum(1.0, roc / 10)   # scale by momentum magnitude
+        return codes, _entry_strength(codes, strength)
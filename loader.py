@@ -9,14 +9,23 @@ Design decisions:
 """
 
 from __future__ import annotations
+import functools
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
-from algotrader.core import MarketEvent
+from algotrader.core import CLOSE, OHLCV_FIELDS, VOLUME, MarketView
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:                       # pyarrow is optional
+    pa = pacsv = None
 
 log = logging.getLogger(__name__)
 
@@ -31,8 +40,13 @@ def validate_ohlcv(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
     """
     Validate and clean a raw OHLCV DataFrame.
     Raises ValueError on unrecoverable issues.
+
+    Never mutates `df`: each fix builds a new frame, and steps with
+    nothing to fix are skipped, so a clean frame holding only the OHLCV
+    columns is returned as is (extra columns are dropped via a copy).
     """
-    df.columns = [c.lower() for c in df.columns]
+    if any(c != c.lower() for c in df.columns):
+        df = df.rename(columns=str.lower)
     missing = REQUIRED_COLS - set(df.columns)
     if missing:
         raise ValueError(f"[{symbol}] Missing columns: {missing}")
@@ -40,33 +54,41 @@ def validate_ohlcv(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
     if not isinstance(df.index, pd.DatetimeIndex):
         raise TypeError(f"[{symbol}] Index must be DatetimeIndex")
 
-    if not df.index.is_monotonic_increasing:
+    if not df.index.is_monotonic_increasing:     # cached on the index
         log.warning("[%s] Index not sorted — sorting now.", symbol)
         df = df.sort_index()
 
-    # Drop exact duplicates
-    n_dup = df.index.duplicated().sum()
-    if n_dup:
-        log.warning("[%s] Dropping %d duplicate timestamps.", symbol, n_dup)
-        df = df[~df.index.duplicated(keep="last")]
-
-    # OHLC sanity
-    bad_hl = (df["high"] < df["low"]).sum()
+    # Drop exact duplicates — is_unique is cached on the index, so a clean
+    # frame never walks it again
+    if not df.index.is_unique:
+        dup = df.index.duplicated(keep="last")
+        log.warning("[%s] Dropping %d duplicate timestamps.", symbol, int(dup.sum()))
+        df = df[~dup]
+
+    # OHLC sanity — swap high/low where inverted (both from the raw values)
+    high = df["high"].to_numpy()
+    low  = df["low"].to_numpy()
+    bad_hl = int((high < low).sum())
     if bad_hl:
         log.warning("[%s] %d bars with high < low — clamping.", symbol, bad_hl)
-        df["high"] = df[["high", "low"]].max(axis=1)
-        df["low"]  = df[["high", "low"]].min(axis=1)
+        df = df.assign(high=np.maximum(high, low), low=np.minimum(high, low))
 
     # Forward-fill small gaps (≤ 5 bars), drop leading NaNs
-    df = df.ffill(limit=5).dropna()
+    if df.isna().to_numpy().any():
+        df = df.ffill(limit=5).dropna()
 
-    # Ensure numeric types
-    for col in REQUIRED_COLS:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+    # Ensure numeric types (already-numeric columns are left alone)
+    coerce = {
+        col: pd.to_numeric(df[col], errors="coerce")
+        for col in REQUIRED_COLS if not pd.api.types.is_numeric_dtype(df[col])
+    }
+    if coerce:
+        df = df.assign(**coerce).dropna(subset=list(REQUIRED_COLS))
 
-    df = df.dropna(subset=list(REQUIRED_COLS))
     log.info("[%s] Validated: %d bars from %s to %s",
              symbol, len(df), df.index[0].date(), df.index[-1].date())
+    if len(df.columns) == len(REQUIRED_COLS):     # exactly OHLCV already
+        return df
     return df[list(REQUIRED_COLS)]
 
 
@@ -103,33 +125,105 @@ def resample_ohlcv(df: pd.DataFrame, rule: str) -> pd.DataFrame:
 # ─────────────────────────────────────────────
 
 class CSVLoader:
-    """Load OHLCV data from CSV files."""
+    """
+    Load OHLCV data from CSV files.
+
+    With `cache_dir` set (and pyarrow installed), each validated and
+    resampled frame is also written to a Parquet file keyed by the CSV's
+    path, mtime and `resample_to`; later loads of an unchanged file read
+    that instead of re-parsing.
+    """
 
     def __init__(
         self,
         data_dir: str = ".",
         date_col: str = "date",
         resample_to: Optional[str] = None,
+        cache_dir: Optional[str] = None,
     ):
         self.data_dir   = Path(data_dir)
         self.date_col   = date_col
         self.resample_to = resample_to
+        self.cache_dir  = Path(cache_dir) if cache_dir and pa is not None else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def load(self, symbol: str) -> pd.DataFrame:
         path = self.data_dir / f"{symbol}.csv"
         if not path.exists():
             raise FileNotFoundError(f"No data file for {symbol} at {path}")
 
-        df = pd.read_csv(path, parse_dates=[self.date_col], index_col=self.date_col)
+        cache_path = self._cache_path(symbol, path)
+        if cache_path is not None and cache_path.exists():
+            log.info("[%s] Loaded from cache %s", symbol, cache_path.name)
+            return pd.read_parquet(cache_path, engine="pyarrow")
+
+        df = self._read(path)
         df = validate_ohlcv(df, symbol)
 
         if self.resample_to:
             df = resample_ohlcv(df, self.resample_to)
 
+        if cache_path is not None:
+            # Older versions of this source (same path and resample_to,
+            # earlier mtime) can never be hit again — drop them
+            source_prefix = cache_path.name.rsplit("_", 1)[0]
+            for stale in self.cache_dir.glob(f"{source_prefix}_*.parquet"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+            df.to_parquet(cache_path, engine="pyarrow", compression="zstd")
         return df
 
+    def _cache_path(self, symbol: str, path: Path) -> Optional[Path]:
+        """
+        <symbol>_<source key>_<version key>.parquet — the source key hashes
+        the CSV path and resample_to, the version key its mtime.
+        """
+        if self.cache_dir is None:
+            return None
+        source  = hashlib.blake2b(f"{path.resolve()}:{self.resample_to}".encode(), digest_size=8)
+        version = hashlib.blake2b(str(path.stat().st_mtime_ns).encode(), digest_size=4)
+        return self.cache_dir / f"{symbol}_{source.hexdigest()}_{version.hexdigest()}.parquet"
+
     def load_many(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
-        return {s: self.load(s) for s in symbols}
+        """Load symbols concurrently — pyarrow parsing and file I/O release the GIL."""
+        if len(symbols) <= 1:
+            return {s: self.load(s) for s in symbols}
+        with ThreadPoolExecutor(max_workers=min(32, len(symbols))) as ex:
+            return dict(zip(symbols, ex.map(self.load, symbols)))
+
+    def _read(self, path: Path) -> pd.DataFrame:
+        """
+        Parse a CSV into a frame indexed by `date_col`.  Uses pyarrow's
+        multithreaded C++ reader (prices as float64, dates as timestamps)
+        when available, pandas otherwise.
+        """
+        if pacsv is None:
+            return self._read_pandas(path)
+
+        # Dates are pinned to timestamp so Arrow parses them in C++; formats
+        # it rejects (US-style dates, UTC offsets, ...) go through pandas
+        column_types = {c: pa.float64() for c in OHLCV_FIELDS}
+        column_types[self.date_col] = pa.timestamp("ns")
+        read_opts    = pacsv.ReadOptions(use_threads=True, block_size=16 << 20)
+        convert_opts = pacsv.ConvertOptions(column_types=column_types)
+
+        # Memory-map the file so the parser reads straight from the page
+        # cache; fall back to a plain file where mmap is unavailable
+        try:
+            source = pa.memory_map(str(path), "r")
+        except OSError:
+            source = pa.OSFile(str(path), "r")
+        try:
+            with source:
+                table = pacsv.read_csv(source, read_options=read_opts, convert_options=convert_opts)
+        except pa.ArrowInvalid as exc:
+            log.debug("pyarrow could not parse %s (%s) — using pandas", path.name, exc)
+            return self._read_pandas(path)
+        return table.to_pandas(self_destruct=True, split_blocks=True).set_index(self.date_col)
+
+    def _read_pandas(self, path: Path) -> pd.DataFrame:
+        return pd.read_csv(path, parse_dates=[self.date_col], index_col=self.date_col)
 
 
 class DataFrameLoader:
@@ -140,7 +234,7 @@ class DataFrameLoader:
         self.resample_to = resample_to
 
     def load(self, symbol: str) -> pd.DataFrame:
-        df = validate_ohlcv(self._frames[symbol].copy(), symbol)
+        df = validate_ohlcv(self._frames[symbol], symbol)   # does not mutate its input
         if self.resample_to:
             df = resample_ohlcv(df, self.resample_to)
         return df
@@ -153,61 +247,185 @@ class DataFrameLoader:
 # Bar Iterator  (the core anti-lookahead engine)
 # ─────────────────────────────────────────────
 
+def _as_ns(index: pd.DatetimeIndex) -> np.ndarray:
+    """int64 nanoseconds, whatever the index resolution (pandas ≥ 2 may be us/s)."""
+    return index.values.astype("datetime64[ns]").view("i8")
+
+
 class BarFeed:
     """
-    Merges multiple symbol DataFrames and yields one MarketEvent at a time
+    Merges multiple symbol DataFrames and yields one bar at a time
     in strict chronological order.
 
+    OHLCV is held columnar as a single (n_bars, n_symbols, 5) float64 block
+    aligned on the merged index; each bar is exposed as a MarketView over
+    one slice of it, so no per-symbol objects are created in the loop.
+
     Only bars UP TO (and including) the current timestamp are ever visible,
     making lookahead bias structurally impossible.
     """
 
+    def __new__(cls, data: Optional[Dict[str, pd.DataFrame]] = None, *args, **kwargs):
+        # One symbol → the specialised feed (its __init__ is inherited).
+        # `data` defaults to None because pickle/copy call cls.__new__(cls)
+        # with no arguments; they already name the concrete class.
+        if cls is BarFeed and data is not None and len(data) == 1:
+            cls = SingleSymbolBarFeed
+        return super().__new__(cls)
+
     def __init__(self, data: Dict[str, pd.DataFrame]):
         self._data = data
-        # Align on a common index
+        self._symbols    = list(data.keys())
+        self._symbol_ids = {s: j for j, s in enumerate(self._symbols)}
+
+        # Per-symbol int64 ns timestamps and a (5, n) block so each OHLCV
+        # column slices as a contiguous view (history_np reads these)
+        self._ts_ns = {s: _as_ns(df.index) for s, df in data.items()}
+
+        # Align on a common index: sorted union of the raw timestamps
+        self._index_ns = functools.reduce(np.union1d, self._ts_ns.values())
+        index = pd.DatetimeIndex(self._index_ns.view("datetime64[ns]"))
+        tz    = next(iter(data.values())).index.tz      # int64 ns are UTC
         self._index: pd.DatetimeIndex = (
-            pd.concat([df["close"] for df in data.values()], axis=1)
-            .sort_index()
-            .index
+            index if tz is None else index.tz_localize("UTC").tz_convert(tz)
         )
+        self._cols  = {
+            s: np.ascontiguousarray(df[list(OHLCV_FIELDS)].to_numpy(dtype=np.float64).T)
+            for s, df in data.items()
+        }
+        # Feed bar index of each symbol row: both indexes are sorted and the
+        # symbol's is a subset of the feed's, so a binary search aligns them
+        self._pos = {s: np.searchsorted(self._index_ns, ts) for s, ts in self._ts_ns.items()}
+
+        self._bars = np.full((len(self._index), len(data), len(OHLCV_FIELDS)), np.nan)
+        for j, s in enumerate(self._symbols):
+            self._bars[self._pos[s], j, :] = self._cols[s].T
+        self._present = ~np.isnan(self._bars[:, :, CLOSE])
+        # Bar dollar volume, computed once for every slippage lookup
+        self._adv     = np.maximum(self._bars[:, :, VOLUME] * self._bars[:, :, CLOSE], 1.0)
+
+        # (symbol, period) → trailing ATR per symbol row, built on first use
+        self._atr_cache: Dict[Tuple[str, int], np.ndarray] = {}
 
     @property
     def symbols(self) -> List[str]:
-        return list(self._data.keys())
+        return self._symbols
 
     @property
     def index(self) -> pd.DatetimeIndex:
         return self._index
 
-    def __iter__(self) -> Iterator[Tuple[pd.Timestamp, Dict[str, MarketEvent]]]:
+    def symbol_id(self, symbol: str) -> int:
+        """Column of `symbol` in the OHLCV block (and in MarketView rows)."""
+        return self._symbol_ids[symbol]
+
+    def bar_positions(self, symbol: str) -> np.ndarray:
+        """Feed bar index (position in `self.index`) of each of `symbol`'s rows."""
+        return self._pos[symbol]
+
+    def __iter__(self) -> Iterator[Tuple[pd.Timestamp, MarketView]]:
         """
-        Yields (timestamp, {symbol: MarketEvent}) for every bar.
-        Symbols with no data on a given date are omitted from the dict.
+        Yields (timestamp, MarketView) for every bar.
+        Symbols with no data on a given date are absent from the view.
         """
-        for ts in self._index:
-            events: Dict[str, MarketEvent] = {}
-            for symbol, df in self._data.items():
-                if ts in df.index:
-                    row = df.loc[ts]
-                    events[symbol] = MarketEvent(
-                        timestamp=ts,
-                        symbol=symbol,
-                        open=float(row["open"]),
-                        high=float(row["high"]),
-                        low=float(row["low"]),
-                        close=float(row["close"]),
-                        volume=float(row["volume"]),
-                    )
-            if events:
-                yield ts, events
+        symbols, ids = self._symbols, self._symbol_ids
+        for i, ts in enumerate(self._index):
+            present = self._present[i]
+            if present.any():
+                yield ts, MarketView(ts, i, self._bars[i], present, self._adv[i], symbols, ids)
 
     def history(self, symbol: str, up_to: pd.Timestamp, n: Optional[int] = None) -> pd.DataFrame:
         """
         Return historical bars for a symbol strictly up to `up_to`.
         Strategies MUST use this method — never index the raw DataFrame directly.
         """
-        df = self._data[symbol]
-        hist = df[df.index <= up_to]
-        if n is not None:
-            hist = hist.iloc[-n:]
-        return hist
+        end   = int(np.searchsorted(self._ts_ns[symbol], up_to.value, side="right"))
+        start = 0 if n is None else max(0, end - n)
+        return self._data[symbol].iloc[start:end]
+
+    def history_np(
+        self, symbol: str, up_to: pd.Timestamp, n: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        NumPy counterpart of `history`: (open, high, low, close, volume)
+        arrays for bars strictly up to `up_to`.  Zero-copy views — treat
+        them as read-only.
+        """
+        end   = int(np.searchsorted(self._ts_ns[symbol], up_to.value, side="right"))
+        start = 0 if n is None else max(0, end - n)
+        o, h, l, c, v = self._cols[symbol][:, start:end]
+        return o, h, l, c, v
+
+    def atr(self, symbol: str, up_to: pd.Timestamp, period: int = 14) -> float:
+        """
+        Trailing ATR (mean True Range of the last `period` bars) at the
+        latest bar ≤ `up_to` — same value as risk.manager.compute_atr on
+        that history.  The whole series is computed once per (symbol, period).
+        NaN until `period + 1` bars are available.
+        """
+        key = (symbol, period)
+        atr = self._atr_cache.get(key)
+        if atr is None:
+            _, h, l, c, _ = self._cols[symbol]
+            atr = np.full(h.shape[0], np.nan)
+            if h.shape[0] > period:
+                tr = np.maximum.reduce([
+                    h[1:] - l[1:],
+                    np.abs(h[1:] - c[:-1]),
+                    np.abs(l[1:] - c[:-1]),
+                ])
+                atr[period:] = np.lib.stride_tricks.sliding_window_view(tr, period).mean(axis=1)
+            self._atr_cache[key] = atr
+
+        row = int(np.searchsorted(self._ts_ns[symbol], up_to.value, side="right")) - 1
+        return float(atr[row]) if row >= 0 else np.nan
+
+    def get_full(self, symbol: str) -> pd.DataFrame:
+        """
+        Full bar history for a symbol, for one-off indicator precomputation.
+        Only trailing-window (causal) transforms are safe on this frame —
+        per-bar logic must still index up to the current bar.
+        """
+        return self._data[symbol]
+
+
+class SingleSymbolBarFeed(BarFeed):
+    """
+    BarFeed specialised for one symbol; `BarFeed(data)` returns one
+    automatically when `data` holds a single frame.
+
+    The merged index is the symbol's own index, so bar i is row i: the
+    per-bar presence check and the per-call symbol → array dict lookups
+    are hoisted out.
+    """
+
+    def __init__(self, data: Dict[str, pd.DataFrame]):
+        super().__init__(data)
+        (self._symbol,) = self._symbols
+        self._df    = self._data[self._symbol]
+        self._ts    = self._ts_ns[self._symbol]
+        self._block = self._cols[self._symbol]
+        self._rows  = np.flatnonzero(self._present[:, 0]).tolist()
+
+    def _end(self, symbol: str, up_to: pd.Timestamp) -> int:
+        if symbol != self._symbol:
+            raise KeyError(symbol)
+        return int(np.searchsorted(self._ts, up_to.value, side="right"))
+
+    def __iter__(self) -> Iterator[Tuple[pd.Timestamp, MarketView]]:
+        symbols, ids, index = self._symbols, self._symbol_ids, self._index
+        bars, present, adv  = self._bars, self._present, self._adv
+        for i in self._rows:
+            ts = index[i]
+            yield ts, MarketView(ts, i, bars[i], present[i], adv[i], symbols, ids)
+
+    def history(self, symbol: str, up_to: pd.Timestamp, n: Optional[int] = None) -> pd.DataFrame:
+        end = self._end(symbol, up_to)
+        return self._df.iloc[0 if n is None else max(0, end - n):end]
+
+    def history_np(
+        self, symbol: str, up_to: pd.Timestamp, n: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        end = self._end(symbol, up_to)
+        o, h, l, c, v = self._block[:, 0 if n is None else max(0, end - n):end]
+        return o, h, l, c, v
@@ -10,13 +10,13 @@ Responsibilities:
 
 from __future__ import annotations
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional
 
 import numpy as np
 import pandas as pd
 
 from algotrader.core import (
-    MarketEvent, OrderEvent, OrderSide, OrderType, SignalEvent, SignalDirection
+    MarketEvent, OrderEvent, OrderSide, OrderType, SignalEvent, SignalDirection, njit
 )
 from algotrader.data.loader import BarFeed
 
@@ -27,6 +27,16 @@ log = logging.getLogger(__name__)
 # ATR Calculation (no lookahead — uses history up_to bar)
 # ─────────────────────────────────────────────
 
+@njit(cache=True)
+def _atr_kernel(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int) -> float:
+    """Mean True Range of the last `period` bars, in one pass without temporaries."""
+    n = highs.shape[0]
+    s = 0.0
+    for i in range(n - period, n):
+        s += max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+    return s / period
+
+
 def compute_atr(df: pd.DataFrame, period: int = 14) -> float:
     """
     Compute ATR from the last `period` bars.
@@ -35,16 +45,30 @@ def compute_atr(df: pd.DataFrame, period: int = 14) -> float:
     if len(df) < period + 1:
         return np.nan
 
-    highs  = df["high"].values
-    lows   = df["low"].values
-    closes = df["close"].values
+    return float(_atr_kernel(
+        df["high"].to_numpy(dtype=np.float64),
+        df["low"].to_numpy(dtype=np.float64),
+        df["close"].to_numpy(dtype=np.float64),
+        period,
+    ))
+
+
+def atr_series(df: pd.DataFrame, period: int = 14) -> pd.Series:
+    """
+    Vectorised counterpart of `compute_atr`: the same trailing ATR at every
+    bar of `df`.  NaN until `period + 1` bars are available.
+    """
+    highs  = df["high"].to_numpy()
+    lows   = df["low"].to_numpy()
+    closes = df["close"].to_numpy()
 
-    tr = np.maximum.reduce([
+    tr = np.full(len(df), np.nan)
+    tr[1:] = np.maximum.reduce([
         highs[1:]  - lows[1:],
         np.abs(highs[1:]  - closes[:-1]),
         np.abs(lows[1:]   - closes[:-1]),
     ])
-    return float(np.mean(tr[-period:]))
+    return pd.Series(tr, index=df.index).rolling(period).mean()
 
 
 # ─────────────────────────────────────────────
@@ -133,12 +157,20 @@ class RiskManager:
     def process_signals(
         self,
         signals:          List[SignalEvent],
-        market_events:    Dict[str, MarketEvent],
+        market_events:    Mapping[str, MarketEvent],
         feed:             BarFeed,
         equity:           float,
         open_positions:   Dict[str, float],   # symbol → qty held
+        n_long_positions: Optional[int] = None,
     ) -> List[OrderEvent]:
+        """
+        `n_long_positions` is the number of held longs (Portfolio keeps it
+        as a running count); it is derived from `open_positions` if omitted.
+        """
         orders: List[OrderEvent] = []
+        if n_long_positions is None:
+            n_long_positions = sum(q > 0 for q in open_positions.values())
+        at_max_longs = not self.allow_short and n_long_positions >= self.max_open_positions
 
         for sig in signals:
             bar = market_events.get(sig.symbol)
@@ -147,17 +179,17 @@ class RiskManager:
 
             price = bar.close   # sizing off current close; fill on next open
 
-            # ── ATR for sizing and stops ──────────────────
-            hist = feed.history(sig.symbol, up_to=sig.timestamp, n=self.atr_period + 5)
-            atr  = compute_atr(hist, self.atr_period)
+            # ── ATR for sizing and stops (precomputed per symbol) ──
+            atr = feed.atr(sig.symbol, sig.timestamp, self.atr_period)
 
             # ── Determine action ──────────────────────────
             held_qty = open_positions.get(sig.symbol, 0.0)
 
-            if sig.direction == SignalDirection.LONG:
+            direction = sig.direction
+            if direction is SignalDirection.LONG:
                 if held_qty > 0:
                     continue   # already long
-                if not self.allow_short and len([s for s, q in open_positions.items() if q > 0]) >= self.max_open_positions:
+                if at_max_longs:
                     log.debug("Max open positions reached — skipping %s", sig.symbol)
                     continue
 
@@ -178,7 +210,7 @@ class RiskManager:
                     take_profit=tp,
                 ))
 
-            elif sig.direction == SignalDirection.FLAT:
+            elif direction is SignalDirection.FLAT:
                 if held_qty > 0:
                     orders.append(OrderEvent(
                         timestamp=sig.timestamp,
@@ -196,7 +228,7 @@ class RiskManager:
                         quantity=abs(held_qty),
                     ))
 
-            elif sig.direction == SignalDirection.SHORT and self.allow_short:
+            elif direction is SignalDirection.SHORT and self.allow_short:
                 if held_qty < 0:
                     continue
                 qty = self.sizer.size(equity, price, atr, sig.strength)
@@ -215,7 +247,7 @@ class RiskManager:
     def check_stop_conditions(
         self,
         open_positions_detail: Dict[str, Dict],   # symbol → {qty, entry, sl, tp}
-        market_events:         Dict[str, MarketEvent],
+        market_events:         Mapping[str, MarketEvent],
     ) -> List[OrderEvent]:
         """
         Check existing positions for stop-loss / take-profit triggers
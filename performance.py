@@ -10,11 +10,13 @@ Metrics:
 """
 
 from __future__ import annotations
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from algotrader.core import njit
+
 
 TRADING_DAYS_PER_YEAR = 252
 
@@ -37,10 +39,13 @@ def sharpe_ratio(
     risk_free_rate: float = 0.0,
     periods_per_year: int = TRADING_DAYS_PER_YEAR,
 ) -> float:
-    excess = returns - risk_free_rate / periods_per_year
-    if excess.std(ddof=1) == 0:
+    n, mean, m2, _, _, _ = _returns_kernel(
+        np.asarray(returns, dtype=np.float64), risk_free_rate / periods_per_year
+    )
+    std = _sample_std(n, m2)
+    if std == 0:
         return 0.0
-    return float(excess.mean() / excess.std(ddof=1) * np.sqrt(periods_per_year))
+    return float(mean / std * np.sqrt(periods_per_year))
 
 
 def sortino_ratio(
@@ -48,19 +53,18 @@ def sortino_ratio(
     risk_free_rate: float = 0.0,
     periods_per_year: int = TRADING_DAYS_PER_YEAR,
 ) -> float:
-    excess    = returns - risk_free_rate / periods_per_year
-    downside  = excess[excess < 0]
-    downside_std = downside.std(ddof=1) if len(downside) > 1 else 0.0
+    n, mean, _, dn, _, dm2 = _returns_kernel(
+        np.asarray(returns, dtype=np.float64), risk_free_rate / periods_per_year
+    )
+    downside_std = _sample_std(dn, dm2) if dn > 1 else 0.0
     if downside_std == 0:
-        return np.inf if excess.mean() > 0 else 0.0
-    return float(excess.mean() / downside_std * np.sqrt(periods_per_year))
+        return np.inf if mean > 0 else 0.0
+    return float(mean / downside_std * np.sqrt(periods_per_year))
 
 
 def max_drawdown(equity_curve: pd.Series) -> float:
     """Returns max drawdown as a negative fraction (e.g. -0.25 = -25%)."""
-    rolling_max = equity_curve.cummax()
-    drawdown = (equity_curve - rolling_max) / rolling_max
-    return float(drawdown.min())
+    return float(_curve_stats(np.asarray(equity_curve, dtype=np.float64), 0.0)[-1])
 
 
 def calmar_ratio(
@@ -80,10 +84,10 @@ def rolling_sharpe(
     risk_free_rate: float = 0.0,
 ) -> pd.Series:
     """Rolling Sharpe over a trailing window."""
-    excess = returns - risk_free_rate / periods_per_year
-    roll_mean = excess.rolling(window).mean()
-    roll_std  = excess.rolling(window).std(ddof=1)
-    return (roll_mean / roll_std) * np.sqrt(periods_per_year)
+    out = _rolling_sharpe_kernel(
+        np.asarray(returns, dtype=np.float64), window, risk_free_rate / periods_per_year
+    )
+    return pd.Series(out * np.sqrt(periods_per_year), index=returns.index)
 
 
 def exposure(returns: pd.Series, equity_curve: pd.Series = None) -> float:
@@ -95,8 +99,273 @@ def exposure(returns: pd.Series, equity_curve: pd.Series = None) -> float:
 
 
 def drawdown_series(equity_curve: pd.Series) -> pd.Series:
-    rolling_max = equity_curve.cummax()
-    return (equity_curve - rolling_max) / rolling_max
+    out = _drawdown_kernel(equity_curve.to_numpy(dtype=np.float64))
+    return pd.Series(out, index=equity_curve.index, name=equity_curve.name)
+
+
+def derived_series(
+    equity_curve: pd.Series,
+    window: int = 63,
+    periods_per_year: int = TRADING_DAYS_PER_YEAR,
+    risk_free_rate: float = 0.0,
+) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """
+    (returns, drawdown_series, rolling_sharpe) from one pass over the
+    equity curve.  Returns and rolling Sharpe start at the second bar,
+    as with ec.pct_change().dropna().
+    """
+    ret, dd, rsh = _derived_kernel(
+        equity_curve.to_numpy(dtype=np.float64), window, risk_free_rate / periods_per_year
+    )
+    index = equity_curve.index
+    return (
+        pd.Series(ret, index=index[1:]),
+        pd.Series(dd, index=index, name=equity_curve.name),
+        pd.Series(rsh * np.sqrt(periods_per_year), index=index[1:]),
+    )
+
+
+# ─────────────────────────────────────────────
+# Compiled kernels (single pass, online moments)
+# ─────────────────────────────────────────────
+
+@njit(cache=True)
+def _welford(n: int, mean: float, m2: float, x: float):
+    """Fold x into a running (count, mean, sum of squared deviations)."""
+    n   += 1
+    d    = x - mean
+    mean += d / n
+    m2  += d * (x - mean)
+    return n, mean, m2
+
+
+@njit(cache=True)
+def _returns_kernel(returns: np.ndarray, rf_per_period: float):
+    """
+    Online moments of excess returns x = r − rf_per_period, NaNs skipped:
+      (n, mean, m2, n_down, mean_down, m2_down)   — "down" means x < 0
+    """
+    n, mean, m2    = 0, 0.0, 0.0
+    dn, dmean, dm2 = 0, 0.0, 0.0
+    for i in range(returns.shape[0]):
+        r = returns[i]
+        if np.isnan(r):
+            continue
+        x = r - rf_per_period
+        n, mean, m2 = _welford(n, mean, m2, x)
+        if x < 0.0:
+            dn, dmean, dm2 = _welford(dn, dmean, dm2, x)
+    return n, mean, m2, dn, dmean, dm2
+
+
+@njit(cache=True)
+def _curve_kernel(ec: np.ndarray, rf_per_period: float):
+    """
+    One streaming pass over an equity curve (len ≥ 1).  Returns the
+    accumulators every headline metric derives from:
+      (n_returns, mean, m2, n_down, mean_down, m2_down, n_nonzero, max_dd)
+    — online (Welford) moments of x = period return − rf_per_period,
+    "down" meaning x < 0.
+    """
+    n, mean, m2    = 0, 0.0, 0.0
+    dn, dmean, dm2 = 0, 0.0, 0.0
+    nz   = 0
+    peak = ec[0]
+    mdd  = 0.0
+    for i in range(1, ec.shape[0]):
+        r = ec[i] / ec[i - 1] - 1.0
+        if r != 0.0:
+            nz += 1
+        x = r - rf_per_period
+        n, mean, m2 = _welford(n, mean, m2, x)
+        if x < 0.0:
+            dn, dmean, dm2 = _welford(dn, dmean, dm2, x)
+        if ec[i] > peak:
+            peak = ec[i]
+        dd = (ec[i] - peak) / peak
+        if dd < mdd:
+            mdd = dd
+    return n, mean, m2, dn, dmean, dm2, nz, mdd
+
+
+@njit(cache=True)
+def _drawdown_kernel(ec: np.ndarray) -> np.ndarray:
+    """(equity − running peak) / running peak, in one pass."""
+    out  = np.empty(ec.shape[0])
+    peak = -np.inf
+    for i in range(ec.shape[0]):
+        if ec[i] > peak:
+            peak = ec[i]
+        out[i] = (ec[i] - peak) / peak
+    return out
+
+
+@njit(cache=True)
+def _window_push(k: int, n_nan: int, mean: float, m2: float, x: float):
+    """x enters a trailing window tracked as (finite count, NaN count, mean, m2)."""
+    if np.isnan(x):
+        return k, n_nan + 1, mean, m2
+    k, mean, m2 = _welford(k, mean, m2, x)
+    return k, n_nan, mean, m2
+
+
+@njit(cache=True)
+def _window_pop(k: int, n_nan: int, mean: float, m2: float, x: float):
+    """x leaves the window — the inverse Welford update, O(1)."""
+    if np.isnan(x):
+        return k, n_nan - 1, mean, m2
+    if k == 1:
+        return 0, n_nan, 0.0, 0.0
+    k    -= 1
+    d     = x - mean
+    mean -= d / k
+    m2   -= d * (x - mean)
+    return k, n_nan, mean, m2
+
+
+# Running m2 at or below this (relative) level may be pure rounding residue
+# left by _window_pop; the window is then recomputed exactly.
+_M2_COLLAPSE = 1e-10
+
+
+@njit(cache=True)
+def _window_exact(x: np.ndarray, lo: int, hi: int, rf_per_period: float):
+    """
+    Exact (mean, m2) of x[lo:hi] − rf_per_period by two passes.  A window
+    of identical values gives m2 == 0 and its value as the mean, exactly —
+    the zero-std case pandas' rolling std detects the same way.
+    """
+    first = x[lo]
+    same  = True
+    s     = 0.0
+    for t in range(lo, hi):
+        s += x[t]
+        if x[t] != first:
+            same = False
+    if same:
+        return first - rf_per_period, 0.0
+    mean = s / (hi - lo) - rf_per_period
+    m2   = 0.0
+    for t in range(lo, hi):
+        d   = x[t] - rf_per_period - mean
+        m2 += d * d
+    return mean, m2
+
+
+@njit(cache=True)
+def _window_sharpe(mean: float, m2: float, window: int) -> float:
+    """Per-period Sharpe of a full, NaN-free window (±inf if flat but non-zero)."""
+    std = np.sqrt(max(m2, 0.0) / (window - 1))
+    if std > 0.0:
+        return mean / std
+    if mean != 0.0:
+        return np.inf if mean > 0.0 else -np.inf
+    return np.nan
+
+
+@njit(cache=True)
+def _rolling_sharpe_kernel(returns: np.ndarray, window: int, rf_per_period: float) -> np.ndarray:
+    """
+    Per-period (unannualised) Sharpe over a trailing window, updating the
+    window's mean/m2 in O(1) as a value enters and another leaves.
+    NaN until the window is full and wherever it holds a NaN.  When m2
+    collapses toward zero (flat stretches) the window is recomputed
+    exactly, so constant windows give NaN / ±inf as pandas does rather
+    than a finite ratio of rounding residue.
+    """
+    n   = returns.shape[0]
+    out = np.full(n, np.nan)
+    k, n_nan, mean, m2 = 0, 0, 0.0, 0.0
+    for i in range(n):
+        k, n_nan, mean, m2 = _window_push(k, n_nan, mean, m2, returns[i] - rf_per_period)
+        if i >= window:
+            k, n_nan, mean, m2 = _window_pop(k, n_nan, mean, m2, returns[i - window] - rf_per_period)
+        if i >= window - 1 and n_nan == 0 and window > 1:
+            if m2 <= _M2_COLLAPSE * max(1.0, mean * mean) * window:
+                mean, m2 = _window_exact(returns, i + 1 - window, i + 1, rf_per_period)
+            out[i] = _window_sharpe(mean, m2, window)
+    return out
+
+
+@njit(cache=True)
+def _derived_kernel(ec: np.ndarray, window: int, rf_per_period: float):
+    """
+    Fused single pass over an equity curve:
+      (period returns, drawdown, per-period rolling Sharpe of the returns)
+    — the same values as the separate kernels, one read of `ec`.
+    """
+    n    = ec.shape[0]
+    m    = max(n - 1, 0)
+    ret  = np.empty(m)
+    dd   = np.empty(n)
+    rsh  = np.full(m, np.nan)
+    peak = -np.inf
+    k, n_nan, mean, m2 = 0, 0, 0.0, 0.0
+    for i in range(n):
+        v = ec[i]
+        if v > peak:
+            peak = v
+        dd[i] = (v - peak) / peak
+        if i == 0:
+            continue
+
+        j      = i - 1
+        ret[j] = v / ec[j] - 1.0
+        k, n_nan, mean, m2 = _window_push(k, n_nan, mean, m2, ret[j] - rf_per_period)
+        if j >= window:
+            k, n_nan, mean, m2 = _window_pop(k, n_nan, mean, m2, ret[j - window] - rf_per_period)
+        if j >= window - 1 and n_nan == 0 and window > 1:
+            if m2 <= _M2_COLLAPSE * max(1.0, mean * mean) * window:
+                mean, m2 = _window_exact(ret, j + 1 - window, j + 1, rf_per_period)
+            rsh[j] = _window_sharpe(mean, m2, window)
+    return ret, dd, rsh
+
+
+def _curve_stats(ec: np.ndarray, rf_per_period: float) -> tuple:
+    """
+    _curve_kernel's accumulators, guarding the empty curve the kernel can't
+    index: no returns and a NaN max drawdown, as the pandas versions gave.
+    """
+    if ec.shape[0] == 0:
+        return 0, 0.0, 0.0, 0, 0.0, 0.0, 0, np.nan
+    return _curve_kernel(ec, rf_per_period)
+
+
+def _sample_std(n: int, m2: float) -> float:
+    """ddof=1 standard deviation from a count and sum of squared deviations."""
+    if n < 2:
+        return np.nan
+    return float(np.sqrt(max(m2, 0.0) / (n - 1)))
+
+
+def equity_metrics(
+    equity_curve: pd.Series,
+    risk_free_rate: float = 0.0,
+    periods_per_year: int = TRADING_DAYS_PER_YEAR,
+) -> Dict[str, float]:
+    """
+    CAGR, Sharpe, Sortino, Calmar, max drawdown, exposure and annualised
+    volatility from a single pass over the curve.  Same definitions as
+    the individual metric functions above.
+    """
+    ec = np.asarray(equity_curve, dtype=np.float64)
+    n, mean, m2, dn, _, dm2, nz, mdd = _curve_stats(ec, risk_free_rate / periods_per_year)
+
+    mean     = mean if n else np.nan
+    std      = _sample_std(n, m2)
+    down_std = _sample_std(dn, dm2) if dn > 1 else 0.0
+    growth   = cagr(equity_curve, periods_per_year)
+    ann      = np.sqrt(periods_per_year)
+
+    return {
+        "cagr":         growth,
+        "sharpe":       0.0 if std == 0 else float(mean / std * ann),
+        "sortino":      (np.inf if mean > 0 else 0.0) if down_std == 0 else float(mean / down_std * ann),
+        "calmar":       np.inf if mdd == 0 else growth / abs(mdd),
+        "max_drawdown": float(mdd),
+        "exposure":     nz / n if n else np.nan,
+        "volatility":   std * ann,
+    }
 
 
 # ─────────────────────────────────────────────
@@ -104,31 +373,38 @@ def drawdown_series(equity_curve: pd.Series) -> pd.Series:
 # ─────────────────────────────────────────────
 
 def trade_statistics(trade_log: pd.DataFrame) -> Dict:
-    sells = trade_log[trade_log["side"] == "SELL"].copy()
-    if sells.empty:
+    # Closing (SELL) trades' PnL as one array; every stat reads from it.
+    # Portfolio logs side as a categorical, so the mask compares int codes.
+    is_sell = (trade_log["side"] == "SELL").to_numpy()
+    pnl = trade_log["pnl"].to_numpy(dtype=float)[is_sell]
+    if not pnl.size:
         return {}
 
-    wins   = sells[sells["pnl"] > 0]["pnl"]
-    losses = sells[sells["pnl"] <= 0]["pnl"]
+    is_win = pnl > 0
+    wins   = pnl[is_win]
+    losses = pnl[~is_win]
 
+    n            = pnl.size
+    total        = pnl.sum()
+    mean         = total / n
     gross_profit = wins.sum()
     gross_loss   = abs(losses.sum())
 
     return {
-        "n_trades":        len(sells),
-        "n_wins":          len(wins),
-        "n_losses":        len(losses),
-        "win_rate":        len(wins) / len(sells) if len(sells) else 0,
+        "n_trades":        n,
+        "n_wins":          wins.size,
+        "n_losses":        losses.size,
+        "win_rate":        wins.size / n,
         "profit_factor":   gross_profit / gross_loss if gross_loss else np.inf,
-        "avg_win":         wins.mean()   if len(wins)   else 0,
-        "avg_loss":        losses.mean() if len(losses) else 0,
-        "best_trade":      sells["pnl"].max(),
-        "worst_trade":     sells["pnl"].min(),
-        "avg_trade_pnl":   sells["pnl"].mean(),
-        "total_pnl":       sells["pnl"].sum(),
+        "avg_win":         wins.mean()   if wins.size   else 0,
+        "avg_loss":        losses.mean() if losses.size else 0,
+        "best_trade":      pnl.max(),
+        "worst_trade":     pnl.min(),
+        "avg_trade_pnl":   mean,
+        "total_pnl":       total,
         "gross_profit":    gross_profit,
         "gross_loss":      gross_loss,
-        "expectancy":      sells["pnl"].mean(),
+        "expectancy":      mean,
     }
 
 
@@ -143,20 +419,20 @@ def full_report(
     risk_free_rate:  float = 0.0,
     periods_per_year: int  = TRADING_DAYS_PER_YEAR,
 ) -> Dict:
-    ec      = equity_df["equity"]
-    returns = ec.pct_change().dropna()
+    ec = equity_df["equity"]
+    m  = equity_metrics(ec, risk_free_rate, periods_per_year)
 
     report = {
         "Initial Capital":   f"${initial_capital:,.2f}",
         "Final Equity":      f"${ec.iloc[-1]:,.2f}",
         "Total Return":      f"{(ec.iloc[-1]/ec.iloc[0]-1)*100:.2f}%",
-        "CAGR":              f"{cagr(ec, periods_per_year)*100:.2f}%",
-        "Sharpe Ratio":      f"{sharpe_ratio(returns, risk_free_rate, periods_per_year):.3f}",
-        "Sortino Ratio":     f"{sortino_ratio(returns, risk_free_rate, periods_per_year):.3f}",
-        "Calmar Ratio":      f"{calmar_ratio(ec, periods_per_year):.3f}",
-        "Max Drawdown":      f"{max_drawdown(ec)*100:.2f}%",
-        "Exposure":          f"{exposure(returns)*100:.1f}%",
-        "Volatility (Ann)":  f"{returns.std()*np.sqrt(periods_per_year)*100:.2f}%",
+        "CAGR":              f"{m['cagr']*100:.2f}%",
+        "Sharpe Ratio":      f"{m['sharpe']:.3f}",
+        "Sortino Ratio":     f"{m['sortino']:.3f}",
+        "Calmar Ratio":      f"{m['calmar']:.3f}",
+        "Max Drawdown":      f"{m['max_drawdown']*100:.2f}%",
+        "Exposure":          f"{m['exposure']*100:.1f}%",
+        "Volatility (Ann)":  f"{m['volatility']*100:.2f}%",
         "Total Commission":  f"${equity_df.get('commission', pd.Series([0])).sum():,.2f}" if "commission" in equity_df else "N/A",
         "Start Date":        str(ec.index[0].date()),
         "End Date":          str(ec.index[-1].date()),
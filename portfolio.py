@@ -16,17 +16,17 @@ rather than mutating in place, making the equity curve naturally correct.
 from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import numpy as np
 
-from algotrader.core import FillEvent, MarketEvent, OrderSide
+from algotrader.core import BUY, CLOSE, SELL, FillEvent, MarketView, OrderSide
 
 log = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     symbol:      str
     quantity:    float          # positive = long, negative = short
@@ -46,8 +46,9 @@ class Position:
         return self.quantity * current_price
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecord:
+    """Schema of one trade-log row (Portfolio stores the log columnar)."""
     timestamp:   pd.Timestamp
     symbol:      str
     side:        str
@@ -56,10 +57,54 @@ class TradeRecord:
     commission:  float
     slippage:    float
     pnl:         float = 0.0   # realized PnL (populated on close)
-    order_id:    str = ""
+    order_id:    int = 0
     strategy_id: str = ""
 
 
+# Trade-log column buffers, in TradeRecord field order.  Timestamps are
+# held as int64 ns and viewed as datetime64[ns] when the log is built;
+# side is a core.BUY / core.SELL code, exposed as a "BUY"/"SELL" categorical.
+_TRADE_DTYPES = {
+    "timestamp":   np.int64,
+    "symbol":      object,
+    "side":        np.int8,
+    "quantity":    np.float64,
+    "fill_price":  np.float64,
+    "commission":  np.float64,
+    "slippage":    np.float64,
+    "pnl":         np.float64,
+    "order_id":    np.int64,
+    "strategy_id": object,
+}
+_TRADE_CAPACITY = 1024
+_SIDE_NAMES     = [OrderSide.BUY.value, OrderSide.SELL.value]   # indexed by side code
+
+# Equity-curve column buffers, one row per mark_to_market call; the
+# timestamp buffer (int64 ns) becomes the index
+_EQUITY_DTYPES = {
+    "timestamp":      np.int64,
+    "cash":           np.float64,
+    "holdings_value": np.float64,
+    "equity":         np.float64,
+    "realized_pnl":   np.float64,
+    "unrealized_pnl": np.float64,
+}
+
+
+def _to_datetimes(ns: np.ndarray, tz) -> pd.DatetimeIndex:
+    """Timestamps stored as Timestamp.value (UTC ns) back in their original zone."""
+    index = pd.DatetimeIndex(ns.view("datetime64[ns]"))
+    return index if tz is None else index.tz_localize("UTC").tz_convert(tz)
+
+
+def _grow(cols: Dict[str, np.ndarray], n: int) -> None:
+    """Double every column buffer in place, keeping the first n rows."""
+    for c, arr in cols.items():
+        grown = np.empty(max(2 * n, 1), dtype=arr.dtype)
+        grown[:n] = arr[:n]
+        cols[c] = grown
+
+
 class Portfolio:
     """
     Central accounting ledger for the backtest.
@@ -69,15 +114,35 @@ class Portfolio:
       2. mark_to_market(bars)  — snapshot equity at bar close
     """
 
-    def __init__(self, initial_capital: float = 100_000.0):
+    def __init__(self, initial_capital: float = 100_000.0, n_bars: Optional[int] = None):
+        """`n_bars` pre-sizes the equity curve (the engine passes the feed length)."""
         self.initial_capital = initial_capital
         self.cash            = initial_capital
 
         self._positions:  Dict[str, Position]    = {}
-        self._equity_curve: List[Dict]            = []
-        self._trades:       List[TradeRecord]     = []
+        self._position_pool: List[Position]       = []   # closed, reusable
+        cap = n_bars or _TRADE_CAPACITY
+        self._ec_cols:      Dict[str, np.ndarray] = {
+            c: np.empty(cap, dtype=dt) for c, dt in _EQUITY_DTYPES.items()
+        }
+        self._n_bars:       int                   = 0
+        self._trade_cols:   Dict[str, np.ndarray] = {
+            c: np.empty(_TRADE_CAPACITY, dtype=dt) for c, dt in _TRADE_DTYPES.items()
+        }
+        self._n_trades:     int                   = 0
+        self._tz                                  = None   # feed timezone, from recorded timestamps
+        self._realized_pnl: float                 = 0.0   # running sum of trade pnl
         self._total_commission: float             = 0.0
         self._total_slippage:   float             = 0.0
+        self._n_long:  int                        = 0   # positions with qty > 0
+        self._n_short: int                        = 0   # positions with qty < 0
+        # Open positions as aligned arrays for mark_to_market:
+        # (MarketView column or -1, quantity, avg_entry).  Rebuilt only after
+        # a fill changes a position or the view's symbol map changes.
+        self._mtm:     Tuple[np.ndarray, np.ndarray, np.ndarray] = (
+            np.empty(0, dtype=np.intp), np.empty(0), np.empty(0)
+        )
+        self._mtm_ids: Optional[Dict[str, int]]   = None
 
     # ─────────────────────────────────────────────
     # Fill processing
@@ -99,9 +164,26 @@ class Portfolio:
         log.debug("Fill: %s %s x %.0f @ %.4f  cash=%.2f",
                   fill.side.value, sym, fill.quantity, fill.fill_price, self.cash)
 
+    def _count_sides(self, before: float, after: float) -> None:
+        """Keep the long/short position counts in step with a quantity change."""
+        # int(): quantities are often np.float64, whose bools refuse to subtract
+        self._n_long  += int(after > 0) - int(before > 0)
+        self._n_short += int(after < 0) - int(before < 0)
+
+    def _new_position(self, symbol: str, quantity: float, avg_entry: float) -> Position:
+        """A fresh Position, recycled from closed ones when available."""
+        if not self._position_pool:
+            return Position(symbol=symbol, quantity=quantity, avg_entry=avg_entry)
+        pos = self._position_pool.pop()
+        pos.symbol, pos.quantity, pos.avg_entry = symbol, quantity, avg_entry
+        pos.stop_loss = pos.take_profit = None
+        pos.realized_pnl = 0.0
+        return pos
+
     def _process_buy(self, fill: FillEvent) -> None:
         sym = fill.symbol
-        if sym in self._positions and self._positions[sym].quantity > 0:
+        before = self._positions[sym].quantity if sym in self._positions else 0.0
+        if before > 0:
             # Average up
             pos = self._positions[sym]
             total_qty  = pos.quantity + fill.quantity
@@ -109,11 +191,9 @@ class Portfolio:
             pos.quantity  = total_qty
             pos.avg_entry = avg_entry
         else:
-            self._positions[sym] = Position(
-                symbol=sym,
-                quantity=fill.quantity,
-                avg_entry=fill.fill_price,
-            )
+            self._positions[sym] = self._new_position(sym, fill.quantity, fill.fill_price)
+        self._count_sides(before, self._positions[sym].quantity)
+        self._mtm_ids = None
         self._record_trade(fill, 0.0)
 
     def _process_sell(self, fill: FillEvent) -> float:
@@ -121,29 +201,39 @@ class Portfolio:
         realized = 0.0
         if sym in self._positions:
             pos = self._positions[sym]
+            before = pos.quantity
             realized = (fill.fill_price - pos.avg_entry) * fill.quantity
             pos.quantity -= fill.quantity
             pos.realized_pnl += realized
             if abs(pos.quantity) < 1e-9:
-                del self._positions[sym]
+                self._position_pool.append(self._positions.pop(sym))
+                self._count_sides(before, 0.0)
+            else:
+                self._count_sides(before, pos.quantity)
+            self._mtm_ids = None
         self._record_trade(fill, realized)
         return realized
 
     def _record_trade(self, fill: FillEvent, pnl: float) -> None:
-        self._trades.append(TradeRecord(
-            timestamp=fill.timestamp,
-            symbol=fill.symbol,
-            side=fill.side.value,
-            quantity=fill.quantity,
-            fill_price=fill.fill_price,
-            commission=fill.commission,
-            slippage=fill.slippage,
-            pnl=pnl,
-            order_id=fill.order_id,
-            strategy_id=fill.strategy_id,
-        ))
-
-    def attach_stop_tp(self, order_id: str, symbol: str,
+        cols, n = self._trade_cols, self._n_trades
+        if n == len(cols["pnl"]):
+            _grow(cols, n)
+
+        cols["timestamp"][n]   = fill.timestamp.value
+        self._tz               = fill.timestamp.tz
+        cols["symbol"][n]      = fill.symbol
+        cols["side"][n]        = SELL if fill.side is OrderSide.SELL else BUY
+        cols["quantity"][n]    = fill.quantity
+        cols["fill_price"][n]  = fill.fill_price
+        cols["commission"][n]  = fill.commission
+        cols["slippage"][n]    = fill.slippage
+        cols["pnl"][n]         = pnl
+        cols["order_id"][n]    = fill.order_id
+        cols["strategy_id"][n] = fill.strategy_id
+        self._n_trades      = n + 1
+        self._realized_pnl += pnl
+
+    def attach_stop_tp(self, order_id: int, symbol: str,
                        stop_loss: Optional[float], take_profit: Optional[float]) -> None:
         """Called after fill to store SL/TP on the position."""
         if symbol in self._positions:
@@ -157,34 +247,42 @@ class Portfolio:
     def mark_to_market(
         self,
         timestamp:     pd.Timestamp,
-        market_events: Dict[str, MarketEvent],
+        market_events: MarketView,
     ) -> float:
         """Compute current equity and append to equity curve."""
         holdings_value = 0.0
         unrealized_pnl = 0.0
+        rows, present, ids = market_events.bars, market_events.present, market_events.symbol_ids
+
+        if self._mtm_ids is not ids:
+            positions = self._positions.values()
+            self._mtm = (
+                np.array([ids.get(s, -1) for s in self._positions], dtype=np.intp),
+                np.array([p.quantity  for p in positions], dtype=float),
+                np.array([p.avg_entry for p in positions], dtype=float),
+            )
+            self._mtm_ids = ids
 
-        for sym, pos in self._positions.items():
-            if sym in market_events:
-                price = market_events[sym].close
-            else:
-                price = pos.avg_entry   # stale if no bar
-
-            mv = pos.market_value(price)
-            holdings_value += mv
-            unrealized_pnl += pos.unrealized_pnl(price)
+        cols, qty, entry = self._mtm
+        if qty.size:
+            j     = np.maximum(cols, 0)                      # -1 is masked below
+            price = np.where((cols >= 0) & present[j], rows[j, CLOSE], entry)   # stale if no bar
+            holdings_value = float(qty @ price)
+            unrealized_pnl = float(qty @ (price - entry))
 
         equity = self.cash + holdings_value
-        realized_pnl = sum(t.pnl for t in self._trades)
-
-        self._equity_curve.append({
-            "timestamp":      timestamp,
-            "cash":           self.cash,
-            "holdings_value": holdings_value,
-            "equity":         equity,
-            "realized_pnl":   realized_pnl,
-            "unrealized_pnl": unrealized_pnl,
-            "drawdown":       0.0,   # computed post-hoc
-        })
+
+        i, cols = self._n_bars, self._ec_cols
+        if i == len(cols["equity"]):
+            _grow(cols, i)
+        cols["timestamp"][i]          = timestamp.value
+        self._tz                      = timestamp.tz
+        cols["cash"][i]               = self.cash
+        cols["holdings_value"][i]     = holdings_value
+        cols["equity"][i]             = equity
+        cols["realized_pnl"][i]       = self._realized_pnl
+        cols["unrealized_pnl"][i]     = unrealized_pnl
+        self._n_bars = i + 1
         return equity
 
     # ─────────────────────────────────────────────
@@ -193,12 +291,18 @@ class Portfolio:
 
     @property
     def equity(self) -> float:
-        return self._equity_curve[-1]["equity"] if self._equity_curve else self.initial_capital
+        n = self._n_bars
+        return float(self._ec_cols["equity"][n - 1]) if n else self.initial_capital
 
     @property
     def open_positions(self) -> Dict[str, float]:
         return {s: p.quantity for s, p in self._positions.items()}
 
+    @property
+    def n_long_positions(self) -> int:
+        """Number of open long positions, kept current on every fill."""
+        return self._n_long
+
     @property
     def open_positions_detail(self) -> Dict[str, Dict]:
         return {
@@ -212,14 +316,24 @@ class Portfolio:
         }
 
     def equity_curve(self) -> pd.DataFrame:
-        df = pd.DataFrame(self._equity_curve).set_index("timestamp")
-        if len(df):
-            rolling_max = df["equity"].cummax()
-            df["drawdown"] = (df["equity"] - rolling_max) / rolling_max
+        n      = self._n_bars
+        equity = self._ec_cols["equity"][:n]
+        peak   = np.maximum.accumulate(equity)
+        df = pd.DataFrame(
+            {c: arr[:n] for c, arr in self._ec_cols.items() if c != "timestamp"},
+            index=_to_datetimes(self._ec_cols["timestamp"][:n], self._tz).rename("timestamp"),
+        )
+        df["drawdown"] = (equity - peak) / peak
         return df
 
     def trade_log(self) -> pd.DataFrame:
-        return pd.DataFrame([vars(t) for t in self._trades])
+        n = self._n_trades
+        if not n:
+            return pd.DataFrame()
+        cols = {c: arr[:n] for c, arr in self._trade_cols.items()}
+        cols["timestamp"] = _to_datetimes(cols["timestamp"], self._tz)
+        cols["side"]      = pd.Categorical.from_codes(cols["side"], categories=_SIDE_NAMES)
+        return pd.DataFrame(cols)
 
     def summary_stats(self) -> Dict:
         return {
@@ -228,6 +342,6 @@ class Portfolio:
             "total_return_pct":  (self.equity / self.initial_capital - 1) * 100,
             "total_commission":  self._total_commission,
             "total_slippage":    self._total_slippage,
-            "n_trades":          len(self._trades),
+            "n_trades":          self._n_trades,
             "n_positions_open":  len(self._positions),
         }
@@ -8,23 +8,31 @@ Produces:
   4. Trade PnL distribution histogram
   5. Rolling Sharpe chart
 
-All charts saved to a single multi-panel PNG.
+All charts saved to a single multi-panel PNG, each panel rasterised as a
+separate tile in a worker process and stitched together with Pillow.
 """
 
 from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, Optional
 
 import numpy as np
 import pandas as pd
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-import matplotlib.gridspec as gridspec
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.ticker import FuncFormatter
+from PIL import Image
+
+try:
+    import cairosvg
+except (ImportError, OSError):            # cairosvg (and libcairo) are optional
+    cairosvg = None
 
 from algotrader.analytics.performance import (
-    drawdown_series, rolling_sharpe, full_report, trade_statistics
+    derived_series, full_report, trade_statistics
 )
 
 
@@ -37,6 +45,13 @@ GRID_COL  = "#21262d"
 TEXT_COL  = "#c9d1d9"
 SPINE_COL = "#30363d"
 
+FIG_W     = 16.0    # stitched report size, inches
+FIG_H     = 12.0    # full layout; shorter when the bottom row is empty
+EQUITY_H  = 4.6     # full-width equity row, carries the report title
+TILE_H    = (FIG_H - EQUITY_H) / 2
+
+MIN_POOL_TILES = 3  # fewer tiles (or a single CPU) render in-process
+
 
 def _style_ax(ax):
     ax.set_facecolor(DARK_BG)
@@ -49,6 +64,10 @@ def _style_ax(ax):
     ax.grid(True, color=GRID_COL, linewidth=0.5, alpha=0.7)
 
 
+_MONTHS = ["Jan","Feb","Mar","Apr","May","Jun",
+           "Jul","Aug","Sep","Oct","Nov","Dec"]
+
+
 def _pct_fmt(x, pos):
     return f"{x*100:.0f}%"
 
@@ -56,6 +75,12 @@ def _dollar_fmt(x, pos):
     return f"${x:,.0f}"
 
 
+# Shared across panels: FuncFormatter never reads its bound axis, and
+# each tile is fully drawn before the next one is built.
+_PCT_FMT    = FuncFormatter(_pct_fmt)
+_DOLLAR_FMT = FuncFormatter(_dollar_fmt)
+
+
 class BacktestReport:
     """
     Renders a full backtest report to stdout and PNG.
@@ -89,6 +114,12 @@ class BacktestReport:
 
         self._report = full_report(equity_df, trade_log, initial_capital, risk_free_rate)
 
+        # Derived series, computed once and shared by every chart call
+        self._ec = equity_df["equity"]
+        self._returns, self._dd, self._roll_sh = derived_series(
+            self._ec, window=min(63, max(10, (len(self._ec) - 1)//4))
+        )
+
     # ─────────────────────────────────────────────
     # Text summary
     # ─────────────────────────────────────────────
@@ -111,114 +142,203 @@ class BacktestReport:
     # Charts
     # ─────────────────────────────────────────────
 
-    def plot(self, filename: str = "backtest_report.png", dpi: int = 150) -> Path:
-        ec      = self.equity_df["equity"]
-        returns = ec.pct_change().dropna()
-        dd      = drawdown_series(ec)
-        roll_sh = rolling_sharpe(returns, window=min(63, max(10, len(returns)//4)))
+    def plot(
+        self,
+        filename: str = "backtest_report.png",
+        dpi:      int = 150,
+        workers:  Optional[int] = None,
+        svg:      bool = False,
+    ) -> Path:
+        """
+        Render the five panels as independent tiles and stitch them into
+        one PNG.  Tiles render in parallel worker processes when more than
+        one worker is available (workers=None → CPU count), else in-process.
+        svg=True rasterises each tile from SVG with cairosvg, when it is
+        installed, instead of Agg.
+        """
+        ec, dd, roll_sh = self._ec, self._dd, self._roll_sh
 
         sells = self.trade_log[self.trade_log["side"] == "SELL"] if not self.trade_log.empty else pd.DataFrame()
-
-        fig = plt.figure(figsize=(16, 12), facecolor=DARK_BG)
-        fig.suptitle(
-            f"{self.strategy_name} — Backtest Report",
-            color=TEXT_COL, fontsize=14, fontweight="bold", y=0.98
-        )
-
-        gs = gridspec.GridSpec(
-            3, 2,
-            figure=fig,
-            hspace=0.45, wspace=0.30,
-            left=0.07, right=0.96, top=0.93, bottom=0.06,
-        )
-
-        # ── Panel 1: Equity Curve ─────────────────
-        ax1 = fig.add_subplot(gs[0, :])
-        _style_ax(ax1)
-        ax1.plot(ec.index, ec.values, color=BLUE, linewidth=1.5, label="Portfolio Equity")
-        ax1.fill_between(ec.index, self.initial_capital, ec.values,
-                         where=(ec.values >= self.initial_capital),
-                         alpha=0.15, color=GREEN)
-        ax1.fill_between(ec.index, self.initial_capital, ec.values,
-                         where=(ec.values < self.initial_capital),
-                         alpha=0.15, color=RED)
-        ax1.axhline(self.initial_capital, color=SPINE_COL, linewidth=0.8, linestyle="--")
-        ax1.yaxis.set_major_formatter(FuncFormatter(_dollar_fmt))
-        ax1.set_title("Equity Curve", fontsize=10)
-        ax1.legend(fontsize=8, facecolor=DARK_BG, labelcolor=TEXT_COL, framealpha=0.5)
-
-        # ── Panel 2: Drawdown ─────────────────────
-        ax2 = fig.add_subplot(gs[1, 0])
-        _style_ax(ax2)
-        ax2.fill_between(dd.index, dd.values, 0, color=RED, alpha=0.5)
-        ax2.plot(dd.index, dd.values, color=RED, linewidth=0.8)
-        ax2.yaxis.set_major_formatter(FuncFormatter(_pct_fmt))
-        ax2.set_title("Drawdown", fontsize=10)
-
-        # ── Panel 3: Rolling Sharpe ───────────────
-        ax3 = fig.add_subplot(gs[1, 1])
-        _style_ax(ax3)
-        ax3.plot(roll_sh.index, roll_sh.values, color=AMBER, linewidth=1.2)
-        ax3.axhline(0, color=SPINE_COL, linewidth=0.8, linestyle="--")
-        ax3.axhline(1, color=GREEN,     linewidth=0.6, linestyle=":", alpha=0.6)
-        ax3.set_title("Rolling Sharpe (63-day)", fontsize=10)
-
-        # ── Panel 4: Trade PnL Distribution ──────
-        ax4 = fig.add_subplot(gs[2, 0])
-        _style_ax(ax4)
-        if not sells.empty and "pnl" in sells.columns:
-            pnl = sells["pnl"].dropna()
-            bins = min(50, max(10, len(pnl)//3))
-            colors = [GREEN if v >= 0 else RED for v in pnl]
-            ax4.hist(pnl, bins=bins, color=BLUE, edgecolor=DARK_BG, linewidth=0.3, alpha=0.8)
-            ax4.axvline(0, color=TEXT_COL, linewidth=0.8, linestyle="--")
-            ax4.axvline(pnl.mean(), color=AMBER, linewidth=1.0, linestyle="-", label=f"Mean: ${pnl.mean():.0f}")
-            ax4.xaxis.set_major_formatter(FuncFormatter(_dollar_fmt))
-            ax4.set_title("Trade PnL Distribution", fontsize=10)
-            ax4.legend(fontsize=7, facecolor=DARK_BG, labelcolor=TEXT_COL, framealpha=0.5)
+        pnl   = sells["pnl"].dropna().to_numpy() if "pnl" in sells.columns else np.empty(0)
+
+        title = f"{self.strategy_name} — Backtest Report"
+        half  = FIG_W / 2
+        row3  = EQUITY_H + TILE_H
+        px    = round(half * dpi)     # pixel columns in a half-width tile
+        tiles = [
+            # panel,          args,                                                   box (x, y, w, h) in inches,     suptitle
+            (_panel_equity,   (*_downsample(ec, 2 * px), self.initial_capital),        (0.0,  0.0,      FIG_W, EQUITY_H), title),
+            (_panel_drawdown, _downsample(dd, px),                                     (0.0,  EQUITY_H, half,  TILE_H),   None),
+            (_panel_sharpe,   _downsample(roll_sh, px),                                (half, EQUITY_H, half,  TILE_H),   None),
+        ]
+
+        # Bottom row only holds panels that have something to show; with
+        # no closed trades and under two months of data it is dropped.
+        bottom = []
+        if pnl.size:
+            bottom.append((_panel_pnl_hist, (pnl,)))
+        grid = self._monthly_grid(ec)
+        if grid is not None:
+            bottom.append((_panel_heatmap, grid))
+        tiles += [(p, a, (k * half, row3, half, TILE_H), None) for k, (p, a) in enumerate(bottom)]
+        height = row3 + TILE_H if bottom else row3
+
+        # A pool only pays for its startup and pickling when tiles can
+        # actually render side by side
+        n = min(len(tiles), workers or os.cpu_count() or 1)
+        if n <= 1 or len(tiles) < MIN_POOL_TILES:
+            rasters = [_render_tile(p, a, box[2:], dpi, t, svg) for p, a, box, t in tiles]
         else:
-            ax4.text(0.5, 0.5, "No trade data", ha="center", va="center",
-                     color=TEXT_COL, transform=ax4.transAxes)
-            ax4.set_title("Trade PnL Distribution", fontsize=10)
+            with ProcessPoolExecutor(max_workers=n) as ex:
+                futures = [ex.submit(_render_tile, p, a, box[2:], dpi, t, svg) for p, a, box, t in tiles]
+                rasters = [f.result() for f in futures]
 
-        # ── Panel 5: Monthly Returns Heatmap ──────
-        ax5 = fig.add_subplot(gs[2, 1])
-        _style_ax(ax5)
-        self._monthly_heatmap(ax5, ec)
+        canvas = Image.new("RGB", (round(FIG_W * dpi), round(height * dpi)), DARK_BG)
+        for (_, _, (x, y, _, _), _), (size, rgba) in zip(tiles, rasters):
+            tile = Image.frombuffer("RGBA", size, rgba, "raw", "RGBA", 0, 1)
+            canvas.paste(tile, (round(x * dpi), round(y * dpi)))
 
+        # Encode the PNG once, at a fast zlib level
         path = self.output_dir / filename
-        fig.savefig(path, dpi=dpi, bbox_inches="tight", facecolor=DARK_BG)
-        plt.close(fig)
+        canvas.save(path, format="PNG", compress_level=1, dpi=(dpi, dpi))
         return path
 
-    def _monthly_heatmap(self, ax, equity_curve: pd.Series) -> None:
+    @staticmethod
+    def _monthly_grid(equity_curve: pd.Series) -> Optional[tuple]:
+        """(values, year labels, month labels) for the heatmap; None when < 2 months."""
         monthly = equity_curve.resample("ME").last().pct_change().dropna()
         if monthly.empty:
-            ax.text(0.5, 0.5, "Insufficient data", ha="center", va="center",
-                    color=TEXT_COL, transform=ax.transAxes)
-            ax.set_title("Monthly Returns", fontsize=10)
-            return
-
-        df = pd.DataFrame({
-            "year":  monthly.index.year,
-            "month": monthly.index.month,
-            "ret":   monthly.values,
-        })
-        pivot = df.pivot_table(index="year", columns="month", values="ret", aggfunc="sum")
-        pivot.columns = ["Jan","Feb","Mar","Apr","May","Jun",
-                         "Jul","Aug","Sep","Oct","Nov","Dec"][:len(pivot.columns)]
-
-        im = ax.imshow(pivot.values, aspect="auto", cmap="RdYlGn",
-                       vmin=-0.10, vmax=0.10)
-        ax.set_xticks(range(len(pivot.columns)))
-        ax.set_xticklabels(pivot.columns, fontsize=6, color=TEXT_COL)
-        ax.set_yticks(range(len(pivot.index)))
-        ax.set_yticklabels(pivot.index, fontsize=6, color=TEXT_COL)
-        ax.set_title("Monthly Returns Heatmap", fontsize=10)
-
-        for i in range(len(pivot.index)):
-            for j in range(len(pivot.columns)):
-                val = pivot.values[i, j]
-                if not np.isnan(val):
-                    ax.text(j, i, f"{val*100:.1f}%", ha="center", va="center",
-                            fontsize=5, color="white", fontweight="bold")
+            return None
+
+        # Dense (years × 12) fill: one scatter instead of a pivot_table.
+        year   = monthly.index.year.to_numpy()
+        y0, y1 = int(year.min()), int(year.max())
+        grid   = np.full((y1 - y0 + 1, 12), np.nan)
+        grid[year - y0, monthly.index.month.to_numpy() - 1] = monthly.to_numpy()
+        return grid, list(range(y0, y1 + 1)), _MONTHS
+
+
+# ─────────────────────────────────────────────
+# Panel tiles
+# ─────────────────────────────────────────────
+
+def _downsample(series: pd.Series, width_px: int) -> tuple:
+    """
+    (int64 ns timestamps, values) for plotting a series across width_px
+    pixel columns.  Series longer than 4 points per pixel are reduced to
+    the min and max of each of width_px buckets (plus both endpoints),
+    which keeps every visible peak and trough of the line.
+    """
+    x = series.index.values.astype("datetime64[ns]").view("i8")   # ns whatever the resolution
+    y = series.to_numpy(dtype=np.float64)
+    n = y.shape[0]
+    if n <= 4 * width_px:
+        return x, y
+
+    b      = -(-n // width_px)                 # bucket size, ceil
+    m      = n // b * b
+    starts = np.arange(0, m, b)
+    blocks = y[:m].reshape(-1, b)
+    nan    = np.isnan(blocks)
+    idx    = np.unique(np.concatenate((
+        starts + np.where(nan,  np.inf, blocks).argmin(axis=1),
+        starts + np.where(nan, -np.inf, blocks).argmax(axis=1),
+        np.arange(m, n),
+        (0, n - 1),
+    )))
+    return x[idx], y[idx]
+
+
+# Top-level so they pickle into worker processes; every panel takes only
+# arrays (timestamps as int64 ns) and draws into a single styled axis.
+
+def _render_tile(
+    panel, args: tuple, size: tuple, dpi: int,
+    suptitle: Optional[str] = None, svg: bool = False,
+) -> tuple:
+    """Draw one panel into its own figure and return ((w, h), raw RGBA bytes)."""
+    w, h = size
+    # Bare Figure on an Agg canvas: no pyplot figure manager to register
+    # and tear down, no GridSpec/subplot layout — one axes at fixed margins
+    fig = Figure(figsize=(w, h), dpi=dpi, facecolor=DARK_BG)
+    FigureCanvasAgg(fig)
+    top = 1 - (0.80 if suptitle else 0.35) / h
+    ax  = fig.add_axes((0.75 / w, 0.45 / h, 1 - 1.0 / w, top - 0.45 / h))
+    if suptitle:
+        fig.suptitle(suptitle, color=TEXT_COL, fontsize=14, fontweight="bold", y=1 - 0.12 / h)
+    _style_ax(ax)
+    panel(ax, *args)
+
+    if svg and cairosvg is not None:
+        # Vector export + cairo rasterisation, cheaper than Agg for tiles
+        # with many small artists (e.g. a long heatmap)
+        buf = BytesIO()
+        fig.savefig(buf, format="svg", facecolor=DARK_BG)
+        png = cairosvg.svg2png(bytestring=buf.getvalue(),
+                               output_width=round(w * dpi), output_height=round(h * dpi))
+        img = Image.open(BytesIO(png)).convert("RGBA")
+        return img.size, img.tobytes()
+
+    fig.canvas.draw()
+    size = fig.canvas.get_width_height()
+    rgba = bytes(fig.canvas.buffer_rgba())
+    return size, rgba
+
+
+def _panel_equity(ax, ts: np.ndarray, equity: np.ndarray, initial_capital: float) -> None:
+    t = ts.view("datetime64[ns]")
+    ax.plot(t, equity, color=BLUE, linewidth=1.5, label="Portfolio Equity")
+    ax.fill_between(t, initial_capital, equity,
+                    where=(equity >= initial_capital),
+                    alpha=0.15, color=GREEN)
+    ax.fill_between(t, initial_capital, equity,
+                    where=(equity < initial_capital),
+                    alpha=0.15, color=RED)
+    ax.axhline(initial_capital, color=SPINE_COL, linewidth=0.8, linestyle="--")
+    ax.yaxis.set_major_formatter(_DOLLAR_FMT)
+    ax.set_title("Equity Curve", fontsize=10)
+    ax.legend(fontsize=8, facecolor=DARK_BG, labelcolor=TEXT_COL, framealpha=0.5)
+
+
+def _panel_drawdown(ax, ts: np.ndarray, dd: np.ndarray) -> None:
+    t = ts.view("datetime64[ns]")
+    ax.fill_between(t, dd, 0, color=RED, alpha=0.5)
+    ax.plot(t, dd, color=RED, linewidth=0.8)
+    ax.yaxis.set_major_formatter(_PCT_FMT)
+    ax.set_title("Drawdown", fontsize=10)
+
+
+def _panel_sharpe(ax, ts: np.ndarray, roll_sh: np.ndarray) -> None:
+    ax.plot(ts.view("datetime64[ns]"), roll_sh, color=AMBER, linewidth=1.2)
+    ax.axhline(0, color=SPINE_COL, linewidth=0.8, linestyle="--")
+    ax.axhline(1, color=GREEN,     linewidth=0.6, linestyle=":", alpha=0.6)
+    ax.set_title("Rolling Sharpe (63-day)", fontsize=10)
+
+
+def _panel_pnl_hist(ax, pnl: np.ndarray) -> None:
+    bins = min(50, max(10, len(pnl)//3))
+    counts, edges = np.histogram(pnl, bins=bins)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge",
+           color=BLUE, edgecolor=DARK_BG, linewidth=0.3, alpha=0.8)
+    mean = pnl.mean()
+    ax.axvline(0, color=TEXT_COL, linewidth=0.8, linestyle="--")
+    ax.axvline(mean, color=AMBER, linewidth=1.0, linestyle="-", label=f"Mean: ${mean:.0f}")
+    ax.xaxis.set_major_formatter(_DOLLAR_FMT)
+    ax.set_title("Trade PnL Distribution", fontsize=10)
+    ax.legend(fontsize=7, facecolor=DARK_BG, labelcolor=TEXT_COL, framealpha=0.5)
+
+
+def _panel_heatmap(ax, values: np.ndarray, years: list, months: list) -> None:
+    ax.imshow(values, aspect="auto", cmap="RdYlGn", vmin=-0.10, vmax=0.10)
+    ax.set_xticks(range(len(months)))
+    ax.set_xticklabels(months, fontsize=6, color=TEXT_COL)
+    ax.set_yticks(range(len(years)))
+    ax.set_yticklabels(years, fontsize=6, color=TEXT_COL)
+    ax.set_title("Monthly Returns Heatmap", fontsize=10)
+
+    # Format every label in one vectorised call; draw only the filled cells
+    rows, cols = np.nonzero(~np.isnan(values))
+    labels     = np.char.add(np.char.mod("%.1f", values[rows, cols] * 100), "%")
+    for i, j, label in zip(rows.tolist(), cols.tolist(), labels.tolist()):
+        ax.text(j, i, label, ha="center", va="center",
+                fontsize=5, color="white", fontweight="bold")
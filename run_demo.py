@@ -5,13 +5,16 @@ Generates synthetic OHLCV data for 3 tickers, runs 2 strategies simultaneously
 (MA Crossover + RSI Mean Reversion), and produces a full performance report.
 
 Usage:
-    python run_demo.py
+    python run_demo.py            # full demo + report
+    python run_demo.py --check    # short end-to-end smoke run, no output files
 
 No external data files required — synthetic data is generated inline.
 """
 
+import os
 import sys
 import logging
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 
@@ -25,6 +28,8 @@ log = logging.getLogger("demo")
 
 sys.path.insert(0, "/home/claude")   # add parent so 'algotrader' is importable
 
+MIN_POOL_TASKS = 3   # fewer symbols (or a single CPU) are generated in-process
+
 
 # ─────────────────────────────────────────────
 # Synthetic Data Generator
@@ -49,48 +54,37 @@ def generate_synthetic_ohlcv(
     mu    = (annual_drift - 0.5 * annual_vol**2) * dt
     sigma = annual_vol * np.sqrt(dt)
 
-    log_returns = rng.normal(mu, sigma, n_days)
-    closes      = start_price * np.exp(np.cumsum(log_returns))
-
     intraday_vol  = annual_vol * np.sqrt(dt) * 0.5
     overnight_vol = annual_vol * np.sqrt(dt) * 0.3
 
-    opens  = np.empty(n_days)
-    opens[0] = start_price
-    opens[1:] = closes[:-1] * (1 + rng.normal(0, overnight_vol, n_days - 1))
+    # One draw for every shock: log-return, overnight gap, high/low wicks, volume
+    z   = rng.standard_normal((n_days, 5))
+    out = np.empty((n_days, 5))
+    opens, highs, lows, closes, volume = out.T
 
-    highs  = np.maximum(closes, opens) * (1 + np.abs(rng.normal(0, intraday_vol, n_days)))
-    lows   = np.minimum(closes, opens) * (1 - np.abs(rng.normal(0, intraday_vol, n_days)))
-    volume = np.abs(rng.normal(1_000_000, 200_000, n_days)).astype(int)
+    np.cumsum(mu + sigma * z[:, 0], out=closes)
+    np.exp(closes, out=closes)
+    closes *= start_price
 
-    dates = pd.bdate_range("2018-01-02", periods=n_days)
-    return pd.DataFrame({
-        "open":   np.round(opens,  4),
-        "high":   np.round(highs,  4),
-        "low":    np.round(lows,   4),
-        "close":  np.round(closes, 4),
-        "volume": volume,
-    }, index=dates)
+    opens[0]  = start_price
+    opens[1:] = closes[:-1] * (1 + overnight_vol * z[1:, 1])
 
+    np.maximum(closes, opens, out=highs)
+    highs *= 1 + intraday_vol * np.abs(z[:, 2])
+    np.minimum(closes, opens, out=lows)
+    lows  *= 1 - intraday_vol * np.abs(z[:, 3])
 
-# ─────────────────────────────────────────────
-# Main
-# ─────────────────────────────────────────────
+    np.trunc(np.abs(1_000_000 + 200_000 * z[:, 4]), out=volume)
+    np.round(out[:, :4], 4, out=out[:, :4])
 
-def main():
-    # ── 1. Generate synthetic data ────────────────────────────────
-    symbols_cfg = {
-        "AAPL_SYN": dict(start_price=150, annual_drift=0.12, annual_vol=0.28, seed=1),
-        "MSFT_SYN": dict(start_price=300, annual_drift=0.10, annual_vol=0.22, seed=2),
-        "TSLA_SYN": dict(start_price=200, annual_drift=0.15, annual_vol=0.55, seed=3),
-    }
+    dates = pd.bdate_range("2018-01-02", periods=n_days)
+    return pd.DataFrame(out, index=dates, columns=["open", "high", "low", "close", "volume"], copy=False)
 
-    frames = {sym: generate_synthetic_ohlcv(symbol=sym, **cfg)
-              for sym, cfg in symbols_cfg.items()}
-    symbols = list(frames.keys())
-    log.info("Generated synthetic data for: %s", symbols)
 
+def run_backtest(frames: dict, verbose: bool = True):
+    """Steps 2–6 of the demo: data layer, strategies, execution, risk, engine run."""
     # ── 2. Build data layer ───────────────────────────────────────
+    symbols = list(frames.keys())
     from algotrader.data.loader import DataFrameLoader, BarFeed
 
     loader = DataFrameLoader(frames)
@@ -151,10 +145,59 @@ def main():
         broker=broker,
         risk_manager=risk,
         risk_free_rate=0.04,
-        verbose=True,
+        verbose=verbose,
     )
 
-    result = engine.run()
+    return engine.run()
+
+
+def check() -> None:
+    """
+    End-to-end smoke run: a short backtest through the full engine, with
+    the portfolio's running counters checked against the records.
+    """
+    frames = {sym: generate_synthetic_ohlcv(n_days=400, seed=seed, symbol=sym)
+              for seed, sym in enumerate(("AAA_SYN", "BBB_SYN", "CCC_SYN"), start=1)}
+    result = run_backtest(frames, verbose=False)
+
+    ec, tl, pf = result.equity_curve, result.trade_log, result.portfolio
+    assert len(ec) == len(result.feed.index), "equity curve misses bars"
+    assert np.isfinite(ec["equity"].to_numpy()).all(), "non-finite equity"
+    assert not tl.empty, "no trades were filled"
+    assert np.isclose(ec["realized_pnl"].iloc[-1], tl["pnl"].sum()), "realized PnL drifted"
+    n_long = sum(q > 0 for q in pf.open_positions.values())
+    assert pf.n_long_positions == n_long, "long-position counter drifted"
+    log.info("Check passed: %d bars, %d fills, final equity %.2f",
+             len(ec), len(tl), ec["equity"].iloc[-1])
+
+
+# ─────────────────────────────────────────────
+# Main
+# ─────────────────────────────────────────────
+
+def main():
+    # ── 1. Generate synthetic data ────────────────────────────────
+    symbols_cfg = {
+        "AAPL_SYN": dict(start_price=150, annual_drift=0.12, annual_vol=0.28, seed=1),
+        "MSFT_SYN": dict(start_price=300, annual_drift=0.10, annual_vol=0.22, seed=2),
+        "TSLA_SYN": dict(start_price=200, annual_drift=0.15, annual_vol=0.55, seed=3),
+    }
+
+    # Symbols are independent — generate them in worker processes, but only
+    # when a pool can run them side by side (same rule as report tiles)
+    n_workers = min(len(symbols_cfg), os.cpu_count() or 1)
+    if n_workers <= 1 or len(symbols_cfg) < MIN_POOL_TASKS:
+        frames = {sym: generate_synthetic_ohlcv(symbol=sym, **cfg)
+                  for sym, cfg in symbols_cfg.items()}
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as ex:
+            futures = {sym: ex.submit(generate_synthetic_ohlcv, symbol=sym, **cfg)
+                       for sym, cfg in symbols_cfg.items()}
+            frames  = {sym: f.result() for sym, f in futures.items()}
+    symbols = list(frames.keys())
+    log.info("Generated synthetic data for: %s", symbols)
+
+    result = run_backtest(frames)
 
     # ── 7. Generate report ────────────────────────────────────────
     report = result.report(
@@ -173,4 +216,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    check() if "--check" in sys.argv[1:] else main()